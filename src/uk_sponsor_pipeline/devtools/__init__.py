@@ -1,6 +1,8 @@
 """Developer tooling entrypoints for uv run.
 
 These commands wrap common checks without requiring repo scripts in PATH.
+Each entrypoint accepts an optional command runner so tests can record the
+commands without spawning subprocesses.
 """
 
 from __future__ import annotations
@@ -8,25 +10,27 @@ from __future__ import annotations
 import subprocess
 import sys
 import time
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 
 from rich import print as rprint
 
+CommandRunner = Callable[[Sequence[str]], int]
+
 
 def _run(args: Sequence[str]) -> int:
     result = subprocess.run(args, check=False)
     return result.returncode
 
 
-def _run_or_exit(args: Sequence[str]) -> None:
-    raise SystemExit(_run(args))
+def _run_or_exit(args: Sequence[str], runner: CommandRunner) -> None:
+    raise SystemExit(runner(args))
 
 
 def _emit(message: str) -> None:
     rprint(message)
 
 
-def lint() -> None:
+def lint(runner: CommandRunner = _run) -> None:
     steps: list[list[str]] = [
         ["ruff", "check", "src", "tests", "--ignore-noqa", *sys.argv[1:]],
         [sys.executable, "scripts/check_inline_ignores.py"],
@@ -34,35 +38,36 @@ def lint() -> None:
         ["lint-imports"],
     ]
     for args in steps:
-        code = _run(args)
+        code = runner(args)
         if code != 0:
             raise SystemExit(code)
     raise SystemExit(0)
 
 
-def format_code() -> None:
-    _run_or_exit(["ruff", "format", "src", "tests", *sys.argv[1:]])
+def format_code(runner: CommandRunner = _run) -> None:
+    _run_or_exit(["ruff", "format", "src", "tests", *sys.argv[1:]], runner)
 
 
-def format_check() -> None:
-    _run_or_exit(["ruff", "format", "--check", "src", "tests", *sys.argv[1:]])
+def format_check(runner: CommandRunner = _run) -> None:
+    _run_or_exit(["ruff", "format", "--check", "src", "tests", *sys.argv[1:]], runner)
 
 
-def typecheck() -> None:
-    raise SystemExit(_run(["pyright", *sys.argv[1:]]))
+def typecheck(runner: CommandRunner = _run) -> None:
+    raise SystemExit(runner(["pyright", *sys.argv[1:]]))
 
 
-def spelling_check() -> None:
+def spelling_check(runner: CommandRunner = _run) -> None:
     _run_or_exit(
-        [sys.executable, "-m", "uk_sponsor_pipeline.devtools.uwotm8_linter", *sys.argv[1:]]
+        [sys.executable, "-m", "uk_sponsor_pipeline.devtools.uwotm8_linter", *sys.argv[1:]],
+        runner,
     )
 
 
-def test() -> None:
-    _run_or_exit(["pytest", *sys.argv[1:]])
+def test(runner: CommandRunner = _run) -> None:
+    _run_or_exit(["pytest", *sys.argv[1:]], runner)
 
 
-def coverage() -> None:
+def coverage(runner: CommandRunner = _run) -> None:
     _run_or_exit(
         [
             "pytest",
@@ -70,11 +75,12 @@ def coverage() -> None:
             "--cov-report=term-missing",
             "--cov-fail-under=85",
             *sys.argv[1:],
-        ]
+        ],
+        runner,
     )
 
 
-def check() -> None:
+def check(runner: CommandRunner = _run) -> None:
     steps: list[tuple[str, list[str]]] = [
         ("format", ["ruff", "format", "src", "tests"]),
         ("typecheck", ["pyright"]),
@@ -100,7 +106,7 @@ def check() -> None:
     for name, args in steps:
         _emit(f"[bold cyan]→ {name}[/bold cyan] [dim]{' '.join(args)}[/dim]")
         start = time.perf_counter()
-        code = _run(args)
+        code = runner(args)
         duration = time.perf_counter() - start
         if code != 0:
             _emit(f"[bold red]✗ {name} failed[/bold red] [dim]({duration:.2f}s, exit {code})[/dim]")
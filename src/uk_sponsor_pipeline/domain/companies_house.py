@@ -31,7 +31,7 @@ SimilarityFn = Callable[[str, str], float]
 NormaliseFn = Callable[[str], str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchScore:
     """Transparent match scoring with component breakdown."""
 
@@ -52,7 +52,7 @@ class MatchScore:
             return "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateMatch:
     """A candidate company match from Companies House."""
 
@@ -66,7 +66,7 @@ class CandidateMatch:
     query_used: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateScores:
     """Score components for a candidate before creating a MatchScore."""
 
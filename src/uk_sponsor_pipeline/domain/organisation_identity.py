@@ -14,7 +14,9 @@ Usage example:
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Company suffixes to strip (order matters: longer first)
 COMPANY_SUFFIXES = (
@@ -40,6 +42,9 @@ COMPANY_SUFFIXES = (
     "intl",
 )
 
+# Maximum number of query names tried per organisation
+MAX_QUERY_VARIANTS = 5
+
 # Patterns that indicate trading name
 TRADING_AS_PATTERNS = (
     r"\bt/a\b",
@@ -48,6 +53,16 @@ TRADING_AS_PATTERNS = (
     r"\bdba\b",  # doing business as
 )
 
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Delimiters need surrounding whitespace so hyphenated names stay whole.
+_DELIMITER_RE = re.compile(r"\s+[-/|]\s+")
+# Alternation preserves COMPANY_SUFFIXES order, so multi-word suffixes win.
+_SUFFIX_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(suffix) for suffix in COMPANY_SUFFIXES) + r")\b",
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class NormalisedName:
@@ -58,6 +73,7 @@ class NormalisedName:
     variants: list[str]  # Alternative query names
 
 
+@lru_cache(maxsize=65536)
 def normalise_org_name(name: str) -> str:
     """Normalise organisation name for matching.
 
@@ -80,15 +96,13 @@ def normalise_org_name(name: str) -> str:
     s = name.lower().strip()
 
     # Remove punctuation (keep alphanumeric and spaces)
-    s = re.sub(r"[^\w\s]", " ", s)
+    s = _PUNCTUATION_RE.sub(" ", s)
 
     # Remove company suffixes (word boundaries)
-    for suffix in COMPANY_SUFFIXES:
-        pattern = rf"\b{re.escape(suffix)}\b"
-        s = re.sub(pattern, " ", s, flags=re.IGNORECASE)
+    s = _SUFFIX_RE.sub(" ", s)
 
     # Collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WHITESPACE_RE.sub(" ", s).strip()
 
     return s
 
@@ -122,46 +136,52 @@ def extract_bracketed_names(name: str) -> list[str]:
 
 def split_on_delimiters(name: str) -> list[str]:
     """Split name on common delimiters."""
-    parts = re.split(r"\s+[-/|]\s+", name)
-    return [p.strip() for p in parts if p.strip()]
+    parts = (part.strip() for part in _DELIMITER_RE.split(name))
+    return [part for part in parts if part]
+
+
+def _iter_query_variant_candidates(name: str) -> Iterator[str]:
+    """Yield candidate query names after the original, in priority order."""
+    trading = extract_trading_name(name)
+    if trading:
+        yield trading
+        for pattern in TRADING_AS_PATTERNS:
+            match = re.search(pattern, name, re.IGNORECASE)
+            if match:
+                yield name[: match.start()]
+                break
+
+    yield from extract_bracketed_names(name)
+
+    stripped = name.strip()
+    for part in split_on_delimiters(name):
+        if part != stripped:
+            yield part
 
 
 def generate_query_variants(name: str) -> list[str]:
-    """Generate search query variants for Companies House API."""
+    """Generate search query variants for Companies House API.
+
+    Candidates are generated lazily and generation stops once the cap is reached.
+    """
     if not name or not name.strip():
         return []
 
     variants: list[str] = [name.strip()]
     seen_normalised: set[str] = {normalise_org_name(name)}
 
-    def add_variant(v: str) -> None:
-        v = v.strip()
+    for candidate in _iter_query_variant_candidates(name):
+        if len(variants) >= MAX_QUERY_VARIANTS:
+            break
+        v = candidate.strip()
         if not v:
-            return
+            continue
         norm = normalise_org_name(v)
         if norm and norm not in seen_normalised:
             variants.append(v)
             seen_normalised.add(norm)
 
-    trading = extract_trading_name(name)
-    if trading:
-        add_variant(trading)
-        for pattern in TRADING_AS_PATTERNS:
-            match = re.search(pattern, name, re.IGNORECASE)
-            if match:
-                before = name[: match.start()].strip()
-                if before:
-                    add_variant(before)
-                break
-
-    for bracketed in extract_bracketed_names(name):
-        add_variant(bracketed)
-
-    for part in split_on_delimiters(name):
-        if part != name.strip():
-            add_variant(part)
-
-    return variants[:5]
+    return variants
 
 
 def _token_sort_key(name: str) -> str:
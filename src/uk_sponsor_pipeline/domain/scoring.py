@@ -40,8 +40,10 @@ Usage example:
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
+from functools import lru_cache
 
 from ..types import TransformEnrichRow
 from .scoring_profiles import ScoringProfile
@@ -175,15 +177,19 @@ class ScoringFeatures:
         return "unlikely"
 
 
-def parse_sic_list(s: str) -> list[str]:
-    """Parse semicolon/comma-separated SIC codes."""
+@lru_cache(maxsize=4096)
+def parse_sic_list(s: str) -> tuple[str, ...]:
+    """Parse semicolon/comma-separated SIC codes.
+
+    Cached because the same SIC strings recur across companies in a sector.
+    """
     if not s.strip():
-        return []
-    parts = [p.strip() for p in s.replace(",", ";").split(";")]
-    return [p for p in parts if p]
+        return ()
+    parts = (p.strip() for p in s.replace(",", ";").split(";"))
+    return tuple(p for p in parts if p)
 
 
-def score_from_sic(sics: list[str], profile: ScoringProfile | None = None) -> float:
+def score_from_sic(sics: Sequence[str], profile: ScoringProfile | None = None) -> float:
     """Calculate SIC-based tech score."""
     if not sics:
         return DEFAULT_SIC_BASELINE  # Unknown: small baseline
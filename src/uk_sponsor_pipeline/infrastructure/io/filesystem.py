@@ -128,7 +128,7 @@ class LocalFileSystem(FileSystem):
         return path.stat().st_mtime
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskCache(Cache):
     """File-based cache implementation."""
 
@@ -144,19 +144,19 @@ class DiskCache(Cache):
 
     @override
     def get(self, key: str) -> dict[str, object] | None:
-        p = self._path(key)
-        if p.exists():
-            payload = p.read_text(encoding="utf-8")
-            try:
-                return validate_json_as(dict[str, object], payload)
-            except IncomingDataError as exc:
-                raise JsonObjectExpectedError.for_cache_data() from exc
-        return None
+        try:
+            payload = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return validate_json_as(dict[str, object], payload)
+        except IncomingDataError as exc:
+            raise JsonObjectExpectedError.for_cache_data() from exc
 
     @override
     def set(self, key: str, value: dict[str, object]) -> None:
-        p = self._path(key)
-        p.write_text(json.dumps(value, ensure_ascii=False, indent=2), encoding="utf-8")
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        self._path(key).write_text(payload, encoding="utf-8")
 
     @override
     def has(self, key: str) -> bool:
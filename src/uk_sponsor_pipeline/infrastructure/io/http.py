@@ -20,6 +20,7 @@ Usage example:
 
 from __future__ import annotations
 
+import re
 import time
 from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
@@ -80,22 +81,40 @@ def build_companies_house_client(
     )
 
 
+_AUTH_STATUS_CODES = frozenset({401, 403})
+_RATE_LIMIT_STATUS_CODES = frozenset({429})
+_AUTH_ERROR_TEXT = re.compile(r"\b(?:401|unauthori[sz]ed)\b", re.IGNORECASE)
+_RATE_LIMIT_ERROR_TEXT = re.compile(r"\b(?:429|rate limit|too many requests)\b", re.IGNORECASE)
+
+
+def _error_status_code(error: Exception) -> int | None:
+    if isinstance(error, requests.RequestException) and error.response is not None:
+        return error.response.status_code
+    return None
+
+
 def is_auth_error(error: Exception) -> bool:
-    """Check if an exception indicates an authentication error."""
-    if isinstance(error, requests.HTTPError):
-        if error.response is not None and error.response.status_code == 401:
-            return True
-    error_str = str(error).lower()
-    return "401" in error_str or "unauthorized" in error_str or "unauthorised" in error_str
+    """Check if an exception indicates an authentication error.
+
+    The response status code is authoritative; the message is only inspected for
+    errors raised without a response.
+    """
+    status_code = _error_status_code(error)
+    if status_code is not None:
+        return status_code in _AUTH_STATUS_CODES
+    return _AUTH_ERROR_TEXT.search(str(error)) is not None
 
 
 def is_rate_limit_error(error: Exception) -> bool:
-    """Check if an exception indicates a rate limit error."""
-    if isinstance(error, requests.HTTPError):
-        if error.response is not None and error.response.status_code == 429:
-            return True
-    error_str = str(error).lower()
-    return "429" in error_str or "rate limit" in error_str or "too many requests" in error_str
+    """Check if an exception indicates a rate limit error.
+
+    The response status code is authoritative; the message is only inspected for
+    errors raised without a response.
+    """
+    status_code = _error_status_code(error)
+    if status_code is not None:
+        return status_code in _RATE_LIMIT_STATUS_CODES
+    return _RATE_LIMIT_ERROR_TEXT.search(str(error)) is not None
 
 
 def parse_retry_after(headers: Mapping[str, str] | None) -> int | None:
@@ -110,12 +129,11 @@ def parse_retry_after(headers: Mapping[str, str] | None) -> int | None:
         return int(value)
     try:
         dt = parsedate_to_datetime(value)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=UTC)
-        delta = (dt - datetime.now(UTC)).total_seconds()
-        return max(0, int(delta))
-    except (AttributeError, OverflowError, TypeError, ValueError):
+    except (TypeError, ValueError):
         return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return max(0, int((dt - datetime.now(UTC)).total_seconds()))
 
 
 def _response_details(response: requests.Response) -> str:
@@ -21,65 +21,62 @@ from ..protocols import CircuitBreaker as CircuitBreakerProtocol
 from ..protocols import RateLimiter as RateLimiterProtocol
 from ..protocols import RetryPolicy as RetryPolicyProtocol
 
+# Upper bound on cooldown doublings, reached only when the cap cannot be (e.g. a zero timeout).
+_MAX_COOLDOWN_DOUBLINGS = 32
 
-@dataclass
+
+@dataclass(slots=True)
 class RateLimiter(RateLimiterProtocol):
-    """Rate limiter with minimum delay between requests.
+    """Rate limiter using the generic cell rate algorithm (GCRA).
 
-    Enforces both per-minute limits and minimum inter-request delay.
+    Requests are spaced at least `60 / max_rpm` seconds apart with no burst allowance,
+    so a minute never admits more than `max_rpm` requests. State is a single
+    theoretical arrival time, so each call is constant time with no per-minute window
+    to reset. A minimum delay between consecutive requests is always enforced.
     """
 
     max_rpm: int = 600
     min_delay_seconds: float = 0.2
-    requests_this_minute: int = field(default=0, init=False)
-    minute_start: float = field(default_factory=time.monotonic, init=False)
+    theoretical_arrival_time: float = field(default=0.0, init=False)
     last_request_time: float = field(default=0.0, init=False)
 
     @override
     def wait_if_needed(self) -> None:
-        """Block if we've exceeded the rate limit or need inter-request delay."""
+        """Block until the next request conforms to the rate limit and minimum delay."""
         now = time.monotonic()
-
-        # Always enforce minimum delay between requests
-        time_since_last = now - self.last_request_time
-        if time_since_last < self.min_delay_seconds:
-            time.sleep(self.min_delay_seconds - time_since_last)
+        ready_at = max(
+            self.last_request_time + self.min_delay_seconds, self.theoretical_arrival_time
+        )
+        if ready_at > now:
+            time.sleep(ready_at - now)
             now = time.monotonic()
 
-        # Check per-minute limit
-        if self.max_rpm <= 0:
-            self.last_request_time = now
-            return
-        if now - self.minute_start >= 60:
-            # Reset for new minute
-            self.requests_this_minute = 0
-            self.minute_start = now
-        elif self.requests_this_minute >= self.max_rpm:
-            # Wait until the minute is over
-            sleep_time = 60 - (now - self.minute_start) + 0.1
-            time.sleep(sleep_time)
-            self.requests_this_minute = 0
-            self.minute_start = time.monotonic()
-
-        self.requests_this_minute += 1
-        self.last_request_time = time.monotonic()
-
-
-@dataclass
+        if self.max_rpm > 0:
+            interval = 60.0 / self.max_rpm
+            self.theoretical_arrival_time = max(self.theoretical_arrival_time, now) + interval
+        self.last_request_time = now
+
+
+@dataclass(slots=True)
 class CircuitBreaker(CircuitBreakerProtocol):
     """Circuit breaker to prevent repeated failures from causing API bans.
 
-    Opens after `threshold` consecutive failures. Must be manually reset.
+    Opens after `threshold` consecutive failures. After the cooldown a limited number
+    of half-open probes are allowed; each failed probe reopens the circuit with double
+    the previous cooldown, capped at `max_recovery_timeout_seconds` (or at
+    `recovery_timeout_seconds` when that is larger).
     """
 
     threshold: int = 5
     recovery_timeout_seconds: float = 60.0
+    max_recovery_timeout_seconds: float = 600.0
     half_open_max_calls: int = 1
     consecutive_failures: int = field(default=0, init=False)
     state: str = field(default="closed", init=False)  # closed | open | half_open
     opened_at: float | None = field(default=None, init=False)
     open_until: float | None = field(default=None, init=False)
     half_open_calls: int = field(default=0, init=False)
+    consecutive_opens: int = field(default=0, init=False)
 
     @property
     def is_open(self) -> bool:
@@ -93,6 +90,7 @@ class CircuitBreaker(CircuitBreakerProtocol):
         self.opened_at = None
         self.open_until = None
         self.half_open_calls = 0
+        self.consecutive_opens = 0
 
     @override
     def record_failure(self) -> None:
@@ -111,6 +109,9 @@ class CircuitBreaker(CircuitBreakerProtocol):
     @override
     def check(self) -> None:
         """Check if circuit is open - raises if so."""
+        if self.state == "closed":
+            return
+
         if self.state == "open":
             now = time.monotonic()
             if self.open_until is not None and now >= self.open_until:
@@ -132,15 +133,22 @@ class CircuitBreaker(CircuitBreakerProtocol):
         self.opened_at = None
         self.open_until = None
         self.half_open_calls = 0
+        self.consecutive_opens = 0
 
     def _open(self, now: float) -> None:
         self.state = "open"
         self.opened_at = now
-        self.open_until = now + self.recovery_timeout_seconds
+        # The cap never shortens the configured base timeout.
+        ceiling = max(self.recovery_timeout_seconds, self.max_recovery_timeout_seconds)
+        cooldown = min(self.recovery_timeout_seconds * (2**self.consecutive_opens), ceiling)
+        self.open_until = now + cooldown
         self.half_open_calls = 0
+        # Stop doubling once capped so repeated probes cannot overflow the exponent.
+        if cooldown < ceiling and self.consecutive_opens < _MAX_COOLDOWN_DOUBLINGS:
+            self.consecutive_opens += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryPolicy(RetryPolicyProtocol):
     """Retry policy for transient failures."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TypedDict
 
 from pydantic import TypeAdapter, ValidationError
@@ -72,10 +73,16 @@ class LocationAliasesInput(TypedDict, total=False):
     locations: list[LocationProfileInput]
 
 
+@cache
+def _type_adapter[SchemaT](schema: type[SchemaT]) -> TypeAdapter[SchemaT]:
+    """Return a shared adapter per schema; building one compiles a validator."""
+    return TypeAdapter(schema)
+
+
 def validate_as[SchemaT](schema: type[SchemaT], payload: object) -> SchemaT:
     """Validate a payload against a schema."""
     try:
-        return TypeAdapter(schema).validate_python(payload)
+        return _type_adapter(schema).validate_python(payload)
     except ValidationError as exc:
         message = f"Invalid payload for {schema}."
         raise IncomingDataError(message) from exc
@@ -84,7 +91,7 @@ def validate_as[SchemaT](schema: type[SchemaT], payload: object) -> SchemaT:
 def validate_json_as[SchemaT](schema: type[SchemaT], payload: str | bytes | bytearray) -> SchemaT:
     """Validate a JSON payload against a schema."""
     try:
-        return TypeAdapter(schema).validate_json(payload)
+        return _type_adapter(schema).validate_json(payload)
     except ValidationError as exc:
         message = f"Invalid JSON payload for {schema}."
         raise IncomingDataError(message) from exc
@@ -2,6 +2,10 @@
 
 These protocols define the abstract interfaces that pipeline components depend on,
 enabling isolated unit testing with mock implementations.
+
+Protocols that slotted implementations subclass (`Cache`, `RateLimiter`,
+`CircuitBreaker`, `RetryPolicy`) declare empty `__slots__`; a base class without
+them would give every subclass instance a `__dict__` regardless of its own slots.
 """
 
 from __future__ import annotations
@@ -82,6 +86,8 @@ class HttpSession(Protocol):
 class Cache(Protocol):
     """Abstract cache for storing/retrieving JSON data."""
 
+    __slots__ = ()  # Keeps slotted implementations dict-free.
+
     def get(self, key: str) -> dict[str, object] | None:
         """Retrieve cached value by key, or None if not present."""
         ...
@@ -179,6 +185,8 @@ class FileSystem(Protocol):
 class RateLimiter(Protocol):
     """Abstract rate limiter for outbound requests."""
 
+    __slots__ = ()  # Keeps slotted implementations dict-free.
+
     def wait_if_needed(self) -> None:
         """Block until a request is allowed."""
         ...
@@ -188,6 +196,8 @@ class RateLimiter(Protocol):
 class CircuitBreaker(Protocol):
     """Abstract circuit breaker for outbound requests."""
 
+    __slots__ = ()  # Keeps slotted implementations dict-free.
+
     def check(self) -> None:
         """Raise if the circuit is open."""
         ...
@@ -205,6 +215,8 @@ class CircuitBreaker(Protocol):
 class RetryPolicy(Protocol):
     """Abstract retry policy for transient failures."""
 
+    __slots__ = ()  # Keeps slotted implementations dict-free.
+
     max_retries: int
     retry_statuses: tuple[int, ...]
     retry_exceptions: tuple[type[Exception], ...]
@@ -24,6 +24,11 @@ from uk_sponsor_pipeline.infrastructure import LocalFileSystem
 from uk_sponsor_pipeline.io_validation import validate_as
 from uk_sponsor_pipeline.protocols import HttpSession
 
+_REGISTER_CSV = (
+    b"Organisation Name,Town/City,County,Type & Rating,Route\n"
+    b"Acme Ltd,London,Greater London,A rating,Skilled Worker\n"
+)
+
 
 class DummySession(HttpSession):
     """HTTP session stub that streams provided bytes."""
@@ -57,11 +62,7 @@ class DummySession(HttpSession):
 def test_refresh_sponsor_writes_snapshot_and_manifest(tmp_path: Path) -> None:
     fs = LocalFileSystem()
     snapshot_root = tmp_path / "snapshots"
-    payload = (
-        b"Organisation Name,Town/City,County,Type & Rating,Route\n"
-        b"Acme Ltd,London,Greater London,A rating,Skilled Worker\n"
-    )
-    session = DummySession(payload)
+    session = DummySession(_REGISTER_CSV)
     now = datetime(2026, 2, 4, 12, 30, tzinfo=UTC)
 
     progress = FakeProgressReporter()
@@ -91,7 +92,7 @@ def test_refresh_sponsor_writes_snapshot_and_manifest(tmp_path: Path) -> None:
     clean = pd.read_csv(snapshot_dir / "clean.csv", dtype=str).fillna("")
     assert clean["Organisation Name"].tolist() == ["Acme Ltd"]
     assert progress.starts == [("download", None), ("clean", 1)]
-    assert progress.advances == [len(payload), 1]
+    assert progress.advances == [len(_REGISTER_CSV), 1]
     assert progress.finished == 2
 
 
@@ -118,10 +119,6 @@ def test_refresh_sponsor_fails_on_missing_columns(tmp_path: Path) -> None:
 def test_refresh_sponsor_discovers_csv_link(tmp_path: Path) -> None:
     fs = LocalFileSystem()
     snapshot_root = tmp_path / "snapshots"
-    payload = (
-        b"Organisation Name,Town/City,County,Type & Rating,Route\n"
-        b"Acme Ltd,London,Greater London,A rating,Skilled Worker\n"
-    )
     html = """
     <html>
         <body>
@@ -129,7 +126,7 @@ def test_refresh_sponsor_discovers_csv_link(tmp_path: Path) -> None:
         </body>
     </html>
     """
-    session = DummySession(payload, page_html=html)
+    session = DummySession(_REGISTER_CSV, page_html=html)
 
     result = run_refresh_sponsor(
         url=None,
@@ -147,11 +144,7 @@ def test_refresh_sponsor_discovers_csv_link(tmp_path: Path) -> None:
 def test_refresh_sponsor_acquire_writes_pending_raw(tmp_path: Path) -> None:
     fs = LocalFileSystem()
     snapshot_root = tmp_path / "snapshots"
-    payload = (
-        b"Organisation Name,Town/City,County,Type & Rating,Route\n"
-        b"Acme Ltd,London,Greater London,A rating,Skilled Worker\n"
-    )
-    session = DummySession(payload)
+    session = DummySession(_REGISTER_CSV)
 
     result = run_refresh_sponsor_acquire(
         url="https://example.com/sponsor-register-2026-02-01.csv",
@@ -172,11 +165,7 @@ def test_refresh_sponsor_acquire_writes_pending_raw(tmp_path: Path) -> None:
 def test_refresh_sponsor_clean_commits_pending_snapshot(tmp_path: Path) -> None:
     fs = LocalFileSystem()
     snapshot_root = tmp_path / "snapshots"
-    payload = (
-        b"Organisation Name,Town/City,County,Type & Rating,Route\n"
-        b"Acme Ltd,London,Greater London,A rating,Skilled Worker\n"
-    )
-    session = DummySession(payload)
+    session = DummySession(_REGISTER_CSV)
     run_refresh_sponsor_acquire(
         url="https://example.com/sponsor-register-2026-02-01.csv",
         snapshot_root=snapshot_root,
@@ -4,7 +4,6 @@ import csv
 import io
 from datetime import datetime, tzinfo
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
@@ -39,51 +38,92 @@ from uk_sponsor_pipeline.schemas import (
 from uk_sponsor_pipeline.types import CompanyProfile, SearchItem, TransformEnrichResumeReport
 
 
-class TestTransformEnrichAuthIntegration:
-    """Integration tests for Transform enrich authentication."""
+def _register_row(
+    organisation_name: str,
+    org_name_normalised: str,
+    *,
+    town: str = "London",
+    county: str = "Greater London",
+) -> dict[str, str]:
+    """Build a single-location, A-rated Skilled Worker transform register row."""
+    return {
+        "Organisation Name": organisation_name,
+        "org_name_normalised": org_name_normalised,
+        "has_multiple_towns": "False",
+        "has_multiple_counties": "False",
+        "Town/City": town,
+        "County": county,
+        "Type & Rating": "A rating",
+        "Route": "Skilled Worker",
+        "raw_name_variants": organisation_name,
+    }
 
-    def test_api_key_is_passed_to_session(self, tmp_path: Path) -> None:
-        """Verify the API key from config is correctly added to session headers."""
-        fs = LocalFileSystem()
-        # Create minimal transform_register input
-        transform_register_csv = tmp_path / "sponsor_register_filtered.csv"
-        transform_register_csv.write_text(
-            "Organisation Name,org_name_normalised,has_multiple_towns,has_multiple_counties,"
-            "Town/City,County,Type & Rating,Route,raw_name_variants\n"
-            "Test Company Ltd,test company,False,False,London,Greater London,"
-            "A rating,Skilled Worker,Test Company Ltd\n"
-        )
 
-        # Create a config with a known API key
-        test_api_key = "test-api-key-for-verification"
-        config = PipelineConfig(
-            ch_api_key=test_api_key,
-            ch_sleep_seconds=0,
-            ch_max_rpm=600,
-            ch_min_match_score=0.72,
-            ch_search_limit=5,
-        )
+# Companies House search returns no items, so no profile is fetched.
+_EMPTY_SEARCH_RESPONSES: dict[str, dict[str, object]] = {"/search/companies": {"items": []}}
 
-        # Create a mock HTTP client to capture what gets called
-        mock_http = MagicMock()
-        mock_http.get_json.return_value = {"items": []}
 
-        # Run transform_enrich with our mock
-        out_dir = tmp_path / "out"
-        cache_dir = tmp_path / "cache"
+# Transform register rows shared by the batching and resume tests.
+_REGISTER_ROWS: list[dict[str, str]] = [
+    _register_row("Alpha Ltd", "alpha ltd"),
+    _register_row("Beta Ltd", "beta ltd", town="Manchester", county="Greater Manchester"),
+    _register_row("Gamma Ltd", "gamma ltd", town="Leeds", county="West Yorkshire"),
+]
 
-        run_transform_enrich(
-            register_path=transform_register_csv,
-            out_dir=out_dir,
-            cache_dir=cache_dir,
-            config=config,
-            http_client=mock_http,
-            resume=False,
-            fs=fs,
-        )
 
-        # Verify http_client.get_json was called (meaning config was used)
-        assert mock_http.get_json.called
+# Per-query candidate scores; the second query returns the stronger match.
+_ORDERING_SCORES: list[list[CandidateMatch]] = [
+    [
+        CandidateMatch(
+            company_number="1",
+            title="Candidate One",
+            status="active",
+            locality="London",
+            region="Greater London",
+            postcode="EC1A 1BB",
+            score=MatchScore(0.6, 0.5, 0.05, 0.03, 0.02),
+            query_used="q1",
+        )
+    ],
+    [
+        CandidateMatch(
+            company_number="2",
+            title="Candidate Two",
+            status="active",
+            locality="London",
+            region="Greater London",
+            postcode="EC1A 1BB",
+            score=MatchScore(0.7, 0.6, 0.05, 0.03, 0.02),
+            query_used="q2",
+        )
+    ],
+]
+
+
+def _score_single_weak_candidate(
+    *,
+    org_norm: str,
+    town_norm: str,
+    county_norm: str,
+    items: list[SearchItem],
+    query_used: str,
+    similarity_fn: SimilarityFn,
+    normalise_fn: NormaliseFn,
+) -> list[CandidateMatch]:
+    """Stand-in for score_candidates returning one candidate below the match threshold."""
+    score = MatchScore(0.5, 0.5, 0.0, 0.0, 0.0)
+    return [
+        CandidateMatch(
+            company_number="00000001",
+            title=f"{org_norm} Ltd",
+            status="active",
+            locality="",
+            region="",
+            postcode="",
+            score=score,
+            query_used=query_used,
+        )
+    ]
 
 
 def test_transform_enrich_outputs_and_resume_report(
@@ -97,21 +137,7 @@ def test_transform_enrich_outputs_and_resume_report(
     cache_dir = Path("data/cache")
 
     in_memory_fs.write_csv(
-        pd.DataFrame(
-            [
-                {
-                    "Organisation Name": "Acme Ltd",
-                    "org_name_normalised": "acme",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Acme Ltd",
-                }
-            ]
-        ),
+        pd.DataFrame([_register_row("Acme Ltd", "acme")]),
         register_path,
     )
 
@@ -169,14 +195,10 @@ class TestTransformEnrichCandidateOrdering:
     """Tests for candidate ranking across multiple query variants."""
 
     def test_candidates_sorted_across_queries(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, in_memory_fs: InMemoryFileSystem, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        transform_register_csv = tmp_path / "sponsor_register_filtered.csv"
-        transform_register_csv.write_text(
-            "Organisation Name,org_name_normalised,has_multiple_towns,has_multiple_counties,"
-            "Town/City,County,Type & Rating,Route,raw_name_variants\n"
-            "Acme Ltd,acme,False,False,London,Greater London,A rating,Skilled Worker,Acme Ltd\n"
-        )
+        register_path = Path("data/interim/sponsor_register_filtered.csv")
+        in_memory_fs.write_csv(pd.DataFrame([_register_row("Acme Ltd", "acme")]), register_path)
 
         config = PipelineConfig(
             ch_api_key="test-key",
@@ -186,45 +208,12 @@ class TestTransformEnrichCandidateOrdering:
             ch_search_limit=5,
         )
 
-        class DummyHttp:
-            def __init__(self) -> None:
-                self.calls: list[str] = []
-
-            def get_json(self, url: str, cache_key: str | None = None) -> dict[str, object]:
-                self.calls.append(url)
-                return {"items": []}
-
         def fake_variants(org: str) -> list[str]:
             return ["q1", "q2"]
 
         monkeypatch.setattr(s2, "generate_query_variants", fake_variants)
 
-        scores = [
-            [
-                s2.CandidateMatch(
-                    company_number="1",
-                    title="Candidate One",
-                    status="active",
-                    locality="London",
-                    region="Greater London",
-                    postcode="EC1A 1BB",
-                    score=s2.MatchScore(0.6, 0.5, 0.05, 0.03, 0.02),
-                    query_used="q1",
-                )
-            ],
-            [
-                s2.CandidateMatch(
-                    company_number="2",
-                    title="Candidate Two",
-                    status="active",
-                    locality="London",
-                    region="Greater London",
-                    postcode="EC1A 1BB",
-                    score=s2.MatchScore(0.7, 0.6, 0.05, 0.03, 0.02),
-                    query_used="q2",
-                )
-            ],
-        ]
+        scores = [list(query_scores) for query_scores in _ORDERING_SCORES]
 
         def fake_score_candidates(
             *,
@@ -240,20 +229,17 @@ class TestTransformEnrichCandidateOrdering:
 
         monkeypatch.setattr(s2, "score_candidates", fake_score_candidates)
 
-        out_dir = tmp_path / "out"
         outs = run_transform_enrich(
-            register_path=transform_register_csv,
-            out_dir=out_dir,
-            cache_dir=tmp_path / "cache",
+            register_path=register_path,
+            out_dir=Path("data/processed"),
             config=config,
-            http_client=DummyHttp(),
+            http_client=FakeHttpClient(responses=_EMPTY_SEARCH_RESPONSES),
             resume=False,
-            fs=LocalFileSystem(),
+            fs=in_memory_fs,
         )
 
-        candidates_df = pd.read_csv(outs["candidates"], dtype=str).fillna("")
-        top_score = float(str(candidates_df.loc[0, "candidate_score"]))
-        assert top_score == 0.7
+        candidates_df = in_memory_fs.read_csv(outs["candidates"])
+        assert candidates_df["candidate_score"].iat[0] == 0.7
 
 
 class TestTransformEnrichResume:
@@ -269,32 +255,7 @@ class TestTransformEnrichResume:
         out_dir = Path("data/processed")
         cache_dir = Path("data/cache/companies_house")
 
-        df = pd.DataFrame(
-            [
-                {
-                    "Organisation Name": "Alpha Ltd",
-                    "org_name_normalised": "alpha ltd",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Alpha Ltd",
-                },
-                {
-                    "Organisation Name": "Beta Ltd",
-                    "org_name_normalised": "beta ltd",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "Manchester",
-                    "County": "Greater Manchester",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Beta Ltd",
-                },
-            ]
-        )
+        df = pd.DataFrame(_REGISTER_ROWS[:2])
         in_memory_fs.write_csv(df, register_path)
 
         config = PipelineConfig(
@@ -313,31 +274,7 @@ class TestTransformEnrichResume:
 
         monkeypatch.setattr(s2, "generate_query_variants", fake_variants)
 
-        def fake_score_candidates(
-            *,
-            org_norm: str,
-            town_norm: str,
-            county_norm: str,
-            items: list[SearchItem],
-            query_used: str,
-            similarity_fn: SimilarityFn,
-            normalise_fn: NormaliseFn,
-        ) -> list[CandidateMatch]:
-            score = MatchScore(0.5, 0.5, 0.0, 0.0, 0.0)
-            return [
-                CandidateMatch(
-                    company_number="00000001",
-                    title=f"{org_norm} Ltd",
-                    status="active",
-                    locality="",
-                    region="",
-                    postcode="",
-                    score=score,
-                    query_used=query_used,
-                )
-            ]
-
-        monkeypatch.setattr(s2, "score_candidates", fake_score_candidates)
+        monkeypatch.setattr(s2, "score_candidates", _score_single_weak_candidate)
 
         run_transform_enrich(
             register_path=register_path,
@@ -356,7 +293,7 @@ class TestTransformEnrichResume:
         assert len(unmatched_df) == 2
         assert len(checkpoint_df) == 2
         assert len(candidates_df) == 2
-        assert sorted(checkpoint_df["Organisation Name"].tolist()) == ["Alpha Ltd", "Beta Ltd"]
+        assert set(checkpoint_df["Organisation Name"]) == {"Alpha Ltd", "Beta Ltd"}
 
         class FailingHttp:
             calls = 0
@@ -389,43 +326,7 @@ class TestTransformEnrichResume:
         out_dir = Path("data/processed")
         cache_dir = Path("data/cache/companies_house")
 
-        df = pd.DataFrame(
-            [
-                {
-                    "Organisation Name": "Alpha Ltd",
-                    "org_name_normalised": "alpha ltd",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Alpha Ltd",
-                },
-                {
-                    "Organisation Name": "Beta Ltd",
-                    "org_name_normalised": "beta ltd",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "Manchester",
-                    "County": "Greater Manchester",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Beta Ltd",
-                },
-                {
-                    "Organisation Name": "Gamma Ltd",
-                    "org_name_normalised": "gamma ltd",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "Leeds",
-                    "County": "West Yorkshire",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Gamma Ltd",
-                },
-            ]
-        )
+        df = pd.DataFrame(_REGISTER_ROWS)
         in_memory_fs.write_csv(df, register_path)
 
         config = PipelineConfig(
@@ -444,31 +345,7 @@ class TestTransformEnrichResume:
 
         monkeypatch.setattr(s2, "generate_query_variants", fake_variants)
 
-        def fake_score_candidates(
-            *,
-            org_norm: str,
-            town_norm: str,
-            county_norm: str,
-            items: list[SearchItem],
-            query_used: str,
-            similarity_fn: SimilarityFn,
-            normalise_fn: NormaliseFn,
-        ) -> list[CandidateMatch]:
-            score = MatchScore(0.5, 0.5, 0.0, 0.0, 0.0)
-            return [
-                CandidateMatch(
-                    company_number="00000001",
-                    title=f"{org_norm} Ltd",
-                    status="active",
-                    locality="",
-                    region="",
-                    postcode="",
-                    score=score,
-                    query_used=query_used,
-                )
-            ]
-
-        monkeypatch.setattr(s2, "score_candidates", fake_score_candidates)
+        monkeypatch.setattr(s2, "score_candidates", _score_single_weak_candidate)
 
         outs = run_transform_enrich(
             register_path=register_path,
@@ -520,21 +397,7 @@ class TestTransformEnrichFailFast:
     ) -> None:
         register_path = Path("data/interim/sponsor_register_filtered.csv")
         in_memory_fs.write_csv(
-            pd.DataFrame(
-                [
-                    {
-                        "Organisation Name": "Failing Co",
-                        "org_name_normalised": "failing co",
-                        "has_multiple_towns": "False",
-                        "has_multiple_counties": "False",
-                        "Town/City": "London",
-                        "County": "Greater London",
-                        "Type & Rating": "A rating",
-                        "Route": "Skilled Worker",
-                        "raw_name_variants": "Failing Co",
-                    }
-                ]
-            ),
+            pd.DataFrame([_register_row("Failing Co", "failing co")]),
             register_path,
         )
 
@@ -570,21 +433,7 @@ def test_transform_enrich_search_errors_write_resume_report(
     cache_dir = Path("data/cache")
 
     in_memory_fs.write_csv(
-        pd.DataFrame(
-            [
-                {
-                    "Organisation Name": "Failing Co",
-                    "org_name_normalised": "failing co",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Failing Co",
-                }
-            ]
-        ),
+        pd.DataFrame([_register_row("Failing Co", "failing co")]),
         register_path,
     )
 
@@ -650,21 +499,7 @@ def test_transform_enrich_requires_http_client_for_api(
 ) -> None:
     register_path = Path("data/interim/sponsor_register_filtered.csv")
     in_memory_fs.write_csv(
-        pd.DataFrame(
-            [
-                {
-                    "Organisation Name": "Acme Ltd",
-                    "org_name_normalised": "acme",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Acme Ltd",
-                }
-            ]
-        ),
+        pd.DataFrame([_register_row("Acme Ltd", "acme")]),
         register_path,
     )
 
@@ -700,21 +535,7 @@ def test_transform_enrich_profile_fetch_errors_fail_fast(
     cache_dir = Path("data/cache")
 
     in_memory_fs.write_csv(
-        pd.DataFrame(
-            [
-                {
-                    "Organisation Name": "Acme Ltd",
-                    "org_name_normalised": "acme ltd",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Acme Ltd",
-                }
-            ]
-        ),
+        pd.DataFrame([_register_row("Acme Ltd", "acme ltd")]),
         register_path,
     )
 
@@ -805,17 +626,13 @@ def test_resume_false_writes_to_new_output_dir(
 
     monkeypatch.setattr(s2, "datetime", FixedDatetime)
 
-    class DummyHttp:
-        def get_json(self, url: str, cache_key: str | None = None) -> dict[str, object]:
-            return {"items": []}
-
     out_dir = tmp_path / "out"
     outs = run_transform_enrich(
         register_path=transform_register_csv,
         out_dir=out_dir,
         cache_dir=tmp_path / "cache",
         config=config,
-        http_client=DummyHttp(),
+        http_client=FakeHttpClient(responses=_EMPTY_SEARCH_RESPONSES),
         resume=False,
         fs=LocalFileSystem(),
     )
@@ -827,21 +644,7 @@ def test_resume_false_writes_to_new_output_dir(
 def test_transform_enrich_file_source_uses_local_payload(in_memory_fs: InMemoryFileSystem) -> None:
     register_path = Path("data/interim/sponsor_register_filtered.csv")
     in_memory_fs.write_csv(
-        pd.DataFrame(
-            [
-                {
-                    "Organisation Name": "Acme Ltd",
-                    "org_name_normalised": "acme",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Acme Ltd",
-                }
-            ]
-        ),
+        pd.DataFrame([_register_row("Acme Ltd", "acme")]),
         register_path,
     )
 
@@ -905,28 +708,8 @@ def test_transform_enrich_memoises_search_queries_within_run(
     in_memory_fs.write_csv(
         pd.DataFrame(
             [
-                {
-                    "Organisation Name": "Alpha Ltd",
-                    "org_name_normalised": "alpha",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Alpha Ltd",
-                },
-                {
-                    "Organisation Name": "Beta Ltd",
-                    "org_name_normalised": "beta",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Beta Ltd",
-                },
+                _register_row("Alpha Ltd", "alpha"),
+                _register_row("Beta Ltd", "beta"),
             ]
         ),
         register_path,
@@ -983,21 +766,7 @@ def test_transform_enrich_memoises_search_queries_within_run(
 def test_transform_enrich_invalid_source_type_raises(in_memory_fs: InMemoryFileSystem) -> None:
     register_path = Path("data/interim/sponsor_register_filtered.csv")
     in_memory_fs.write_csv(
-        pd.DataFrame(
-            [
-                {
-                    "Organisation Name": "Acme Ltd",
-                    "org_name_normalised": "acme",
-                    "has_multiple_towns": "False",
-                    "has_multiple_counties": "False",
-                    "Town/City": "London",
-                    "County": "Greater London",
-                    "Type & Rating": "A rating",
-                    "Route": "Skilled Worker",
-                    "raw_name_variants": "Acme Ltd",
-                }
-            ]
-        ),
+        pd.DataFrame([_register_row("Acme Ltd", "acme")]),
         register_path,
     )
 
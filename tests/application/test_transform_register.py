@@ -1,49 +1,32 @@
 """Tests for register transform behaviour."""
 
-import json
 from pathlib import Path
 
-import pandas as pd
 import pytest
 
+from tests.support.transform_register_output import TransformRegisterOutput
 from uk_sponsor_pipeline.application.transform_register import run_transform_register
 from uk_sponsor_pipeline.exceptions import DependencyMissingError
-from uk_sponsor_pipeline.infrastructure import LocalFileSystem
-from uk_sponsor_pipeline.io_validation import validate_as
 from uk_sponsor_pipeline.schemas import TRANSFORM_REGISTER_OUTPUT_COLUMNS
 
 
 def test_transform_register_filters_and_aggregates(
-    sample_raw_csv: pd.DataFrame, tmp_path: Path
+    transform_register_output: TransformRegisterOutput,
 ) -> None:
-    fs = LocalFileSystem()
-    raw_dir = tmp_path / "raw"
-    raw_dir.mkdir()
-    in_path = raw_dir / "input.csv"
-    sample_raw_csv.to_csv(in_path, index=False)
-
-    out_path = tmp_path / "interim" / "sponsor_register_filtered.csv"
-    reports_dir = tmp_path / "reports"
-
-    result = run_transform_register(
-        raw_dir=raw_dir,
-        out_path=out_path,
-        reports_dir=reports_dir,
-        fs=fs,
-    )
-
-    df = pd.read_csv(out_path, dtype=str).fillna("")
+    df = transform_register_output.df
 
     assert list(df.columns) == list(TRANSFORM_REGISTER_OUTPUT_COLUMNS)
-    assert result.unique_orgs == 4  # 5 rows with 1 duplicate normalised
+    assert transform_register_output.result.unique_orgs == 4  # 5 rows with 1 duplicate normalised
 
     acme = df[df["org_name_normalised"] == "acme software"].iloc[0]
     assert "ACME SOFTWARE LIMITED" in acme["raw_name_variants"]
 
-    stats = validate_as(
-        dict[str, object],
-        json.loads((reports_dir / "register_stats.json").read_text()),
-    )
+
+def test_transform_register_writes_stats(
+    transform_register_output: TransformRegisterOutput,
+) -> None:
+    stats = transform_register_output.stats
+
     assert isinstance(stats.get("total_raw_rows"), int)
     assert isinstance(stats.get("filtered_rows"), int)
     assert isinstance(stats.get("unique_orgs_normalised"), int)
@@ -2,8 +2,8 @@
 
 import re
 from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
-from types import SimpleNamespace
 from typing import override
 
 import pytest
@@ -16,7 +16,6 @@ from uk_sponsor_pipeline.cli import CliDependencies
 from uk_sponsor_pipeline.config import PipelineConfig
 from uk_sponsor_pipeline.protocols import FileSystem, HttpSession
 
-runner = CliRunner()
 _ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
 
 
@@ -24,6 +23,64 @@ def _strip_ansi(text: str) -> str:
     return _ANSI_ESCAPE_RE.sub("", text)
 
 
+_DEFAULT_PIPELINE_CONFIG = PipelineConfig()
+_FILE_PIPELINE_CONFIG = PipelineConfig(ch_source_type="file")
+
+
+def _default_config_from_env(
+    cls: type[PipelineConfig], dotenv_path: str | None = None
+) -> PipelineConfig:
+    _ = (cls, dotenv_path)
+    return _DEFAULT_PIPELINE_CONFIG
+
+
+def _file_config_from_env(
+    cls: type[PipelineConfig], dotenv_path: str | None = None
+) -> PipelineConfig:
+    _ = (cls, dotenv_path)
+    return _FILE_PIPELINE_CONFIG
+
+
+_FAKE_FROM_ENV = classmethod(_default_config_from_env)
+_FAKE_FILE_FROM_ENV = classmethod(_file_config_from_env)
+_SHORTLIST_OVERRIDE_ARGV = (
+    "admin",
+    "build",
+    "shortlist",
+    "--threshold",
+    "0.4",
+    "--region",
+    "London",
+    "--postcode-prefix",
+    "EC",
+    "--min-employee-count",
+    "1000",
+    "--unknown-employee-count",
+    "include",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeSnapshotPaths:
+    snapshot_date: str
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeAcquireResult:
+    paths: _FakeSnapshotPaths
+    source_url: str
+    raw_path: Path
+    bytes_raw: int
+    raw_csv_path: Path | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeCleanResult:
+    snapshot_dir: Path
+    snapshot_date: str
+    row_counts: dict[str, int]
+
+
 class DummySession(HttpSession):
     """HTTP session stub for CLI tests."""
 
@@ -82,20 +139,15 @@ def _build_app_with_dependencies(deps: CliDependencies) -> typer.Typer:
     return cli.create_app(build_with_shared_deps)
 
 
-def test_cli_version_option_prints_package_version(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_version_option_prints_package_version(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
     monkeypatch.setattr(cli, "__version__", "9.9.9", raising=False)
 
     app = _build_app()
-    result = runner.invoke(app, ["--version"])
+    result = cli_runner.invoke(app, ["--version"])
 
     assert result.exit_code == 0
     plain_output = _strip_ansi(result.output)
@@ -103,19 +155,14 @@ def test_cli_version_option_prints_package_version(monkeypatch: pytest.MonkeyPat
     assert "uship" in plain_output
 
 
-def test_cli_help_shows_grouped_surface_only(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_help_shows_grouped_surface_only(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     app = _build_app()
-    result = runner.invoke(app, ["--help"])
+    result = cli_runner.invoke(app, ["--help"])
     plain_output = _strip_ansi(result.output)
 
     assert result.exit_code == 0
@@ -144,19 +191,12 @@ def test_legacy_flat_commands_fail_with_migration_hints(
     monkeypatch: pytest.MonkeyPatch,
     command: str,
     replacement: str,
+    cli_runner: CliRunner,
 ) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig(ch_source_type="file")
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FILE_FROM_ENV)
 
     app = _build_app()
-    result = runner.invoke(app, [command])
+    result = cli_runner.invoke(app, [command])
     plain_output = _strip_ansi(result.output)
     collapsed_output = " ".join(plain_output.split())
 
@@ -165,17 +205,13 @@ def test_legacy_flat_commands_fail_with_migration_hints(
         assert token in collapsed_output
 
 
-def test_cli_usage_shortlist_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_cli_usage_shortlist_overrides(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
     captured: dict[str, PipelineConfig] = {}
 
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     def fake_run_usage_shortlist(
         scored_path: str | Path,
@@ -189,24 +225,7 @@ def test_cli_usage_shortlist_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(cli, "run_usage_shortlist", fake_run_usage_shortlist)
 
     app = _build_app()
-    result = runner.invoke(
-        app,
-        [
-            "admin",
-            "build",
-            "shortlist",
-            "--threshold",
-            "0.4",
-            "--region",
-            "London",
-            "--postcode-prefix",
-            "EC",
-            "--min-employee-count",
-            "1000",
-            "--unknown-employee-count",
-            "include",
-        ],
-    )
+    result = cli_runner.invoke(app, list(_SHORTLIST_OVERRIDE_ARGV))
 
     assert result.exit_code == 0
     assert captured["config"].tech_score_threshold == 0.4
@@ -218,18 +237,11 @@ def test_cli_usage_shortlist_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_cli_transform_score_overrides_profile_selection(
     monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
 ) -> None:
     captured: dict[str, PipelineConfig] = {}
 
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     def fake_run_transform_score(
         *,
@@ -245,7 +257,7 @@ def test_cli_transform_score_overrides_profile_selection(
     monkeypatch.setattr(cli, "run_transform_score", fake_run_transform_score)
 
     app = _build_app()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         [
             "admin",
@@ -263,7 +275,10 @@ def test_cli_transform_score_overrides_profile_selection(
     assert captured["config"].sector_name == "tech"
 
 
-def test_cli_global_config_file_overrides_env(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_cli_global_config_file_overrides_env(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
     captured: dict[str, PipelineConfig] = {}
     fs = InMemoryFileSystem()
     fs.write_text(
@@ -309,7 +324,7 @@ include_unknown_employee_count = true
     monkeypatch.setattr(cli, "run_usage_shortlist", fake_run_usage_shortlist)
 
     app = _build_app_with_dependencies(deps)
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["--config", "config/pipeline.toml", "admin", "build", "shortlist"],
     )
@@ -324,6 +339,7 @@ include_unknown_employee_count = true
 
 def test_cli_global_config_file_values_can_be_overridden_by_cli(
     monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
 ) -> None:
     captured: dict[str, PipelineConfig] = {}
     fs = InMemoryFileSystem()
@@ -370,7 +386,7 @@ include_unknown_employee_count = true
     monkeypatch.setattr(cli, "run_usage_shortlist", fake_run_usage_shortlist)
 
     app = _build_app_with_dependencies(deps)
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         [
             "--config",
@@ -399,25 +415,20 @@ include_unknown_employee_count = true
     assert captured["config"].include_unknown_employee_count is False
 
 
-def test_cli_global_config_file_missing_fails_fast(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_cli_global_config_file_missing_fails_fast(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
     deps = CliDependencies(
         fs=InMemoryFileSystem(),
         http_session=DummySession(),
         http_client=None,
     )
 
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     app = _build_app_with_dependencies(deps)
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["--config", "config/missing.toml", "admin", "build", "shortlist"],
     )
@@ -427,90 +438,61 @@ def test_cli_global_config_file_missing_fails_fast(monkeypatch: pytest.MonkeyPat
     assert "Config file not found" in plain_output
 
 
-def test_cli_usage_shortlist_rejects_multiple_regions(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
-
-    app = _build_app()
-    result = runner.invoke(
-        app,
-        ["admin", "build", "shortlist", "--region", "London", "--region", "Leeds"],
-    )
-
-    assert result.exit_code != 0
-    plain_output = _strip_ansi(result.output)
-    assert "Only one" in plain_output
-    assert "region" in plain_output
-    assert "value is supported." in plain_output
-
-
-def test_cli_usage_shortlist_rejects_non_positive_min_employee_count(
+@pytest.mark.parametrize(
+    ("argv", "expected_fragments"),
+    [
+        (
+            ["admin", "build", "shortlist", "--region", "London", "--region", "Leeds"],
+            ("Only one", "region", "value is supported."),
+        ),
+        (["admin", "build", "shortlist", "--min-employee-count", "0"], ("min-employee-count",)),
+        (
+            ["admin", "build", "shortlist", "--unknown-employee-count", "sometimes"],
+            ("unknown-employee-count",),
+        ),
+        (["admin", "validate"], ("not implemented in M8-B1",)),
+        (["search"], ("At least one search filter is required",)),
+        (["search", "--size", "giant"], ("size",)),
+        (
+            ["search", "--sector", "tech", "--size", "large", "--region", "London"],
+            ("not implemented in M8-B1",),
+        ),
+    ],
+    ids=[
+        "shortlist-multiple-regions",
+        "shortlist-non-positive-min-employee-count",
+        "shortlist-unknown-employee-count-mode",
+        "admin-validate-placeholder",
+        "search-without-filters",
+        "search-invalid-size-band",
+        "search-placeholder",
+    ],
+)
+def test_cli_rejects_invalid_invocation(
     monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+    argv: list[str],
+    expected_fragments: tuple[str, ...],
 ) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     app = _build_app()
-    result = runner.invoke(
-        app,
-        ["admin", "build", "shortlist", "--min-employee-count", "0"],
-    )
+    result = cli_runner.invoke(app, argv)
 
     assert result.exit_code != 0
     plain_output = _strip_ansi(result.output)
-    assert "min-employee-count" in plain_output
+    for fragment in expected_fragments:
+        assert fragment in plain_output
 
 
-def test_cli_usage_shortlist_rejects_unknown_employee_count_mode(
+def test_cli_run_all_rejects_multiple_regions(
     monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
 ) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
-
-    app = _build_app()
-    result = runner.invoke(
-        app,
-        ["admin", "build", "shortlist", "--unknown-employee-count", "sometimes"],
-    )
-
-    assert result.exit_code != 0
-    plain_output = _strip_ansi(result.output)
-    assert "unknown-employee-count" in plain_output
-
-
-def test_cli_run_all_rejects_multiple_regions(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig(ch_source_type="file")
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FILE_FROM_ENV)
 
     app = _build_app()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["admin", "build", "all", "--region", "London", "--region", "Leeds"],
     )
@@ -522,7 +504,10 @@ def test_cli_run_all_rejects_multiple_regions(monkeypatch: pytest.MonkeyPatch) -
     assert "value is supported." in plain_output
 
 
-def test_cli_run_all_resolves_snapshot_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_cli_run_all_resolves_snapshot_paths(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
     captured_config = PipelineConfig()
     captured_register_path = Path("unset")
 
@@ -565,14 +550,7 @@ def test_cli_run_all_resolves_snapshot_paths(monkeypatch: pytest.MonkeyPatch) ->
         _ = (scored_path, out_dir, config, fs)
         return {"shortlist": Path("short.csv"), "explain": Path("explain.csv")}
 
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig(ch_source_type="file")
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FILE_FROM_ENV)
     monkeypatch.setattr(cli, "run_transform_enrich", fake_run_transform_enrich)
     monkeypatch.setattr(cli, "run_transform_score", fake_run_transform_score)
     monkeypatch.setattr(cli, "run_usage_shortlist", fake_run_usage_shortlist)
@@ -602,7 +580,7 @@ def test_cli_run_all_resolves_snapshot_paths(monkeypatch: pytest.MonkeyPatch) ->
     monkeypatch.setattr(cli, "_resolve_companies_house_paths", fake_resolve_companies_house_paths)
 
     app = _build_app()
-    result = runner.invoke(app, ["admin", "build", "all"])
+    result = cli_runner.invoke(app, ["admin", "build", "all"])
 
     assert result.exit_code == 0
     assert captured_register_path == Path("snapshots/sponsor/2026-02-01/clean.csv")
@@ -613,6 +591,7 @@ def test_cli_run_all_resolves_snapshot_paths(monkeypatch: pytest.MonkeyPatch) ->
 
 def test_cli_run_all_reads_runtime_mode_and_snapshot_root_from_config_file(
     monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
 ) -> None:
     fs = InMemoryFileSystem()
     fs.write_text(
@@ -669,7 +648,7 @@ snapshot_root = "cfg/snapshots"
     monkeypatch.setattr(cli, "run_transform_enrich", fake_run_transform_enrich)
 
     app = _build_app_with_dependencies(deps)
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         [
             "--config",
@@ -686,15 +665,11 @@ snapshot_root = "cfg/snapshots"
     assert captured_snapshot_root == Path("cfg/snapshots")
 
 
-def test_cli_refresh_sponsor_discovery_only(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_refresh_sponsor_discovery_only(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     called = False
 
@@ -718,31 +693,27 @@ def test_cli_refresh_sponsor_discovery_only(monkeypatch: pytest.MonkeyPatch) ->
     monkeypatch.setattr(cli, "resolve_sponsor_csv_url", fake_resolve_sponsor_csv_url)
 
     app = _build_app()
-    result = runner.invoke(app, ["admin", "refresh", "sponsor", "--only", "discovery"])
+    result = cli_runner.invoke(app, ["admin", "refresh", "sponsor", "--only", "discovery"])
 
     assert result.exit_code == 0
     assert called is False
     assert "https://example.com/sponsor.csv" in result.output
 
 
-def test_cli_refresh_sponsor_acquire_only(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_refresh_sponsor_acquire_only(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     called = False
 
-    def fake_run_refresh_sponsor_acquire(**kwargs: object) -> SimpleNamespace:
+    def fake_run_refresh_sponsor_acquire(**kwargs: object) -> _FakeAcquireResult:
         nonlocal called
         _ = kwargs
         called = True
-        return SimpleNamespace(
-            paths=SimpleNamespace(snapshot_date="2026-02-01"),
+        return _FakeAcquireResult(
+            paths=_FakeSnapshotPaths(snapshot_date="2026-02-01"),
             source_url="https://example.com/sponsor.csv",
             raw_path=Path("snapshots/sponsor/.tmp-1/raw.csv"),
             bytes_raw=123,
@@ -751,30 +722,26 @@ def test_cli_refresh_sponsor_acquire_only(monkeypatch: pytest.MonkeyPatch) -> No
     monkeypatch.setattr(cli, "run_refresh_sponsor_acquire", fake_run_refresh_sponsor_acquire)
 
     app = _build_app()
-    result = runner.invoke(app, ["admin", "refresh", "sponsor", "--only", "acquire"])
+    result = cli_runner.invoke(app, ["admin", "refresh", "sponsor", "--only", "acquire"])
 
     assert result.exit_code == 0
     assert called is True
     assert "Acquire sponsor complete" in result.output
 
 
-def test_cli_refresh_sponsor_clean_only(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_refresh_sponsor_clean_only(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     called = False
 
-    def fake_run_refresh_sponsor_clean(**kwargs: object) -> SimpleNamespace:
+    def fake_run_refresh_sponsor_clean(**kwargs: object) -> _FakeCleanResult:
         nonlocal called
         _ = kwargs
         called = True
-        return SimpleNamespace(
+        return _FakeCleanResult(
             snapshot_dir=Path("snapshots/sponsor/2026-02-01"),
             snapshot_date="2026-02-01",
             row_counts={"clean": 1},
@@ -783,22 +750,18 @@ def test_cli_refresh_sponsor_clean_only(monkeypatch: pytest.MonkeyPatch) -> None
     monkeypatch.setattr(cli, "run_refresh_sponsor_clean", fake_run_refresh_sponsor_clean)
 
     app = _build_app()
-    result = runner.invoke(app, ["admin", "refresh", "sponsor", "--only", "clean"])
+    result = cli_runner.invoke(app, ["admin", "refresh", "sponsor", "--only", "clean"])
 
     assert result.exit_code == 0
     assert called is True
     assert "Refresh sponsor complete" in result.output
 
 
-def test_cli_refresh_companies_house_discovery_only(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_refresh_companies_house_discovery_only(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     called = False
 
@@ -824,7 +787,7 @@ def test_cli_refresh_companies_house_discovery_only(monkeypatch: pytest.MonkeyPa
     )
 
     app = _build_app()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["admin", "refresh", "companies-house", "--only", "discovery"],
     )
@@ -834,24 +797,20 @@ def test_cli_refresh_companies_house_discovery_only(monkeypatch: pytest.MonkeyPa
     assert "https://example.com/basic.zip" in result.output
 
 
-def test_cli_refresh_companies_house_acquire_only(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_refresh_companies_house_acquire_only(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     called = False
 
-    def fake_run_refresh_companies_house_acquire(**kwargs: object) -> SimpleNamespace:
+    def fake_run_refresh_companies_house_acquire(**kwargs: object) -> _FakeAcquireResult:
         nonlocal called
         _ = kwargs
         called = True
-        return SimpleNamespace(
-            paths=SimpleNamespace(snapshot_date="2026-02-01"),
+        return _FakeAcquireResult(
+            paths=_FakeSnapshotPaths(snapshot_date="2026-02-01"),
             source_url="https://example.com/basic.zip",
             raw_path=Path("snapshots/companies_house/.tmp-1/raw.zip"),
             raw_csv_path=Path("snapshots/companies_house/.tmp-1/raw.csv"),
@@ -865,7 +824,7 @@ def test_cli_refresh_companies_house_acquire_only(monkeypatch: pytest.MonkeyPatc
     )
 
     app = _build_app()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["admin", "refresh", "companies-house", "--only", "acquire"],
     )
@@ -875,23 +834,19 @@ def test_cli_refresh_companies_house_acquire_only(monkeypatch: pytest.MonkeyPatc
     assert "Acquire Companies House complete" in result.output
 
 
-def test_cli_refresh_companies_house_clean_only(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_refresh_companies_house_clean_only(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FROM_ENV)
 
     called = False
 
-    def fake_run_refresh_companies_house_clean(**kwargs: object) -> SimpleNamespace:
+    def fake_run_refresh_companies_house_clean(**kwargs: object) -> _FakeCleanResult:
         nonlocal called
         _ = kwargs
         called = True
-        return SimpleNamespace(
+        return _FakeCleanResult(
             snapshot_dir=Path("snapshots/companies_house/2026-02-01"),
             snapshot_date="2026-02-01",
             row_counts={"clean": 1},
@@ -904,7 +859,7 @@ def test_cli_refresh_companies_house_clean_only(monkeypatch: pytest.MonkeyPatch)
     )
 
     app = _build_app()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["admin", "refresh", "companies-house", "--only", "clean"],
     )
@@ -914,16 +869,11 @@ def test_cli_refresh_companies_house_clean_only(monkeypatch: pytest.MonkeyPatch)
     assert "Refresh Companies House complete" in result.output
 
 
-def test_cli_run_all_only_usage_shortlist(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = dotenv_path
-        return PipelineConfig(ch_source_type="file")
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
+def test_cli_run_all_only_usage_shortlist(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    monkeypatch.setattr(cli.PipelineConfig, "from_env", _FAKE_FILE_FROM_ENV)
 
     enrich_called = False
     score_called = False
@@ -961,7 +911,7 @@ def test_cli_run_all_only_usage_shortlist(monkeypatch: pytest.MonkeyPatch) -> No
     monkeypatch.setattr(cli, "run_usage_shortlist", fake_run_usage_shortlist)
 
     app = _build_app()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         [
             "admin",
@@ -984,6 +934,7 @@ def test_cli_run_all_only_usage_shortlist(monkeypatch: pytest.MonkeyPatch) -> No
 
 def test_cli_transform_enrich_rejects_api_runtime_mode(
     monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
 ) -> None:
     def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
         _ = dotenv_path
@@ -996,13 +947,16 @@ def test_cli_transform_enrich_rejects_api_runtime_mode(
     )
 
     app = _build_app()
-    result = runner.invoke(app, ["admin", "build", "enrich"])
+    result = cli_runner.invoke(app, ["admin", "build", "enrich"])
 
     assert result.exit_code != 0
     assert "supports CH_SOURCE_TYPE=file only" in result.output
 
 
-def test_cli_run_all_rejects_api_runtime_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_cli_run_all_rejects_api_runtime_mode(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
     def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
         _ = dotenv_path
         return PipelineConfig(ch_source_type="api")
@@ -1014,86 +968,7 @@ def test_cli_run_all_rejects_api_runtime_mode(monkeypatch: pytest.MonkeyPatch) -
     )
 
     app = _build_app()
-    result = runner.invoke(app, ["admin", "build", "all"])
+    result = cli_runner.invoke(app, ["admin", "build", "all"])
 
     assert result.exit_code != 0
     assert "supports CH_SOURCE_TYPE=file only" in result.output
-
-
-def test_admin_validate_command_is_fail_fast_placeholder(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = dotenv_path
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
-
-    app = _build_app()
-    result = runner.invoke(app, ["admin", "validate"])
-
-    assert result.exit_code != 0
-    plain_output = _strip_ansi(result.output)
-    assert "not implemented in M8-B1" in plain_output
-
-
-def test_search_requires_at_least_one_filter(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
-
-    app = _build_app()
-    result = runner.invoke(app, ["search"])
-
-    assert result.exit_code != 0
-    plain_output = _strip_ansi(result.output)
-    assert "At least one search filter is required" in plain_output
-
-
-def test_search_rejects_invalid_size_band(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
-
-    app = _build_app()
-    result = runner.invoke(app, ["search", "--size", "giant"])
-
-    assert result.exit_code != 0
-    plain_output = _strip_ansi(result.output)
-    assert "size" in plain_output
-
-
-def test_search_with_valid_filter_is_fail_fast_placeholder(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_from_env(cls: type[PipelineConfig], dotenv_path: str | None = None) -> PipelineConfig:
-        _ = (cls, dotenv_path)
-        return PipelineConfig()
-
-    monkeypatch.setattr(
-        cli.PipelineConfig,
-        "from_env",
-        classmethod(fake_from_env),
-    )
-
-    app = _build_app()
-    result = runner.invoke(
-        app,
-        ["search", "--sector", "tech", "--size", "large", "--region", "London"],
-    )
-
-    assert result.exit_code != 0
-    plain_output = _strip_ansi(result.output)
-    assert "not implemented in M8-B1" in plain_output
@@ -10,9 +10,14 @@ from collections.abc import Iterator
 
 import pandas as pd
 import pytest
+from typer.testing import CliRunner
 
 from tests.fakes import FakeHttpClient, InMemoryCache, InMemoryFileSystem
 from tests.support.errors import NetworkIsolationError
+from tests.support.transform_register_output import (
+    TransformRegisterOutput,
+    run_transform_register_once,
+)
 
 # =============================================================================
 # Network Isolation - Block all socket connections in tests
@@ -41,6 +46,12 @@ def block_network_access(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
     yield
 
 
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """Provide a Typer CLI runner shared across the test session."""
+    return CliRunner()
+
+
 @pytest.fixture
 def in_memory_cache() -> InMemoryCache:
     """Provide an in-memory cache for tests."""
@@ -53,15 +64,22 @@ def fake_http_client() -> FakeHttpClient:
     return FakeHttpClient()
 
 
-@pytest.fixture
-def in_memory_fs() -> InMemoryFileSystem:
-    """Provide an in-memory filesystem for tests."""
+@pytest.fixture(scope="session")
+def session_in_memory_fs() -> InMemoryFileSystem:
+    """Provide the single in-memory filesystem instance shared by the session."""
     return InMemoryFileSystem()
 
 
 @pytest.fixture
+def in_memory_fs(session_in_memory_fs: InMemoryFileSystem) -> Iterator[InMemoryFileSystem]:
+    """Provide an empty in-memory filesystem, cleared again after each test."""
+    yield session_in_memory_fs
+    session_in_memory_fs.reset()
+
+
+@pytest.fixture(scope="session")
 def sample_raw_csv() -> pd.DataFrame:
-    """Sample raw sponsor register data for testing."""
+    """Sample raw sponsor register data for testing (shared; treat as read-only)."""
     return pd.DataFrame(
         {
             "Organisation Name": [
@@ -91,6 +109,16 @@ def sample_raw_csv() -> pd.DataFrame:
     )
 
 
+@pytest.fixture(scope="session")
+def transform_register_output(
+    sample_raw_csv: pd.DataFrame, tmp_path_factory: pytest.TempPathFactory
+) -> TransformRegisterOutput:
+    """Run the register transform on the sample data once per session."""
+    return run_transform_register_once(
+        sample_raw_csv, tmp_path_factory.mktemp("transform_register")
+    )
+
+
 @pytest.fixture
 def sample_ch_search_response() -> dict[str, object]:
     """Sample Companies House search response."""
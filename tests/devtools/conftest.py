@@ -0,0 +1,15 @@
+"""Pytest fixtures for devtools tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from uk_sponsor_pipeline import devtools
+
+
+@pytest.fixture
+def emit_capture(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Capture devtools progress messages instead of printing them."""
+    emitted: list[str] = []
+    monkeypatch.setattr(devtools, "_emit", emitted.append)
+    return emitted
@@ -1,115 +1,113 @@
 """Tests for devtools entrypoints."""
 
-from types import SimpleNamespace
+from collections.abc import Sequence
 
 import pytest
 
 from uk_sponsor_pipeline import devtools
 
 
-def _capture_run(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
-    calls: list[list[str]] = []
+class RecordingRunner:
+    """Command runner stub that records each command and exits cleanly."""
 
-    def fake_run(args: list[str], check: bool = False) -> SimpleNamespace:
-        calls.append(args)
-        return SimpleNamespace(returncode=0)
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
 
-    monkeypatch.setattr(devtools.subprocess, "run", fake_run)
-    return calls
+    def __call__(self, args: Sequence[str]) -> int:
+        self.calls.append(list(args))
+        return 0
 
 
 def _assert_exit_ok(exc_info: pytest.ExceptionInfo[SystemExit]) -> None:
     assert exc_info.value.code == 0
 
 
+def _assert_first_call_starts_with(calls: Sequence[Sequence[str]], prefix: Sequence[str]) -> None:
+    assert tuple(calls[0][: len(prefix)]) == tuple(prefix)
+
+
 def test_lint_calls_ruff(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls = _capture_run(monkeypatch)
+    runner = RecordingRunner()
     monkeypatch.setattr(devtools.sys, "argv", ["devtools", "--select", "E"])
     with pytest.raises(SystemExit) as exc_info:
-        devtools.lint()
+        devtools.lint(runner=runner)
     _assert_exit_ok(exc_info)
-    assert calls[0][:5] == ["ruff", "check", "src", "tests", "--ignore-noqa"]
-    assert calls[1] == [devtools.sys.executable, "scripts/check_inline_ignores.py"]
-    assert calls[2] == [
+    _assert_first_call_starts_with(runner.calls, ["ruff", "check", "src", "tests", "--ignore-noqa"])
+    assert runner.calls[1] == [devtools.sys.executable, "scripts/check_inline_ignores.py"]
+    assert runner.calls[2] == [
         devtools.sys.executable,
         "-m",
         "uk_sponsor_pipeline.devtools.uwotm8_linter",
         "--no-list",
     ]
-    assert calls[3] == ["lint-imports"]
+    assert runner.calls[3] == ["lint-imports"]
 
 
 def test_format_calls_ruff(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls = _capture_run(monkeypatch)
+    runner = RecordingRunner()
     monkeypatch.setattr(devtools.sys, "argv", ["devtools", "--line-length", "100"])
     with pytest.raises(SystemExit) as exc_info:
-        devtools.format_code()
+        devtools.format_code(runner=runner)
     _assert_exit_ok(exc_info)
-    assert calls[0][:3] == ["ruff", "format", "src"]
+    _assert_first_call_starts_with(runner.calls, ["ruff", "format", "src"])
 
 
 def test_format_check_calls_ruff(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls = _capture_run(monkeypatch)
+    runner = RecordingRunner()
     monkeypatch.setattr(devtools.sys, "argv", ["devtools"])
     with pytest.raises(SystemExit) as exc_info:
-        devtools.format_check()
+        devtools.format_check(runner=runner)
     _assert_exit_ok(exc_info)
-    assert calls[0][:4] == ["ruff", "format", "--check", "src"]
+    _assert_first_call_starts_with(runner.calls, ["ruff", "format", "--check", "src"])
 
 
 def test_typecheck_calls_pyright(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls = _capture_run(monkeypatch)
+    runner = RecordingRunner()
     monkeypatch.setattr(devtools.sys, "argv", ["devtools"])
     with pytest.raises(SystemExit) as exc_info:
-        devtools.typecheck()
+        devtools.typecheck(runner=runner)
     _assert_exit_ok(exc_info)
-    assert calls[0][0] == "pyright"
+    _assert_first_call_starts_with(runner.calls, ["pyright"])
 
 
 def test_test_calls_pytest(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls = _capture_run(monkeypatch)
+    runner = RecordingRunner()
     monkeypatch.setattr(devtools.sys, "argv", ["devtools", "-q"])
     with pytest.raises(SystemExit) as exc_info:
-        devtools.test()
+        devtools.test(runner=runner)
     _assert_exit_ok(exc_info)
-    assert calls[0][0] == "pytest"
+    _assert_first_call_starts_with(runner.calls, ["pytest"])
 
 
 def test_coverage_calls_pytest(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls = _capture_run(monkeypatch)
+    runner = RecordingRunner()
     monkeypatch.setattr(devtools.sys, "argv", ["devtools"])
     with pytest.raises(SystemExit) as exc_info:
-        devtools.coverage()
+        devtools.coverage(runner=runner)
     _assert_exit_ok(exc_info)
-    assert calls[0][:2] == ["pytest", "--cov=uk_sponsor_pipeline"]
-    assert "--cov-fail-under=85" in calls[0]
+    _assert_first_call_starts_with(runner.calls, ["pytest", "--cov=uk_sponsor_pipeline"])
+    assert "--cov-fail-under=85" in runner.calls[0]
 
 
 def test_spelling_check_calls_script(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls = _capture_run(monkeypatch)
+    runner = RecordingRunner()
     monkeypatch.setattr(devtools.sys, "argv", ["devtools"])
     with pytest.raises(SystemExit) as exc_info:
-        devtools.spelling_check()
+        devtools.spelling_check(runner=runner)
     _assert_exit_ok(exc_info)
-    assert calls[0] == [
+    assert runner.calls[0] == [
         devtools.sys.executable,
         "-m",
         "uk_sponsor_pipeline.devtools.uwotm8_linter",
     ]
 
 
-def test_check_runs_quality_gates_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls = _capture_run(monkeypatch)
-    emitted: list[str] = []
-
-    def emit(msg: str) -> None:
-        emitted.append(msg)
-
-    monkeypatch.setattr(devtools, "_emit", emit)
+def test_check_runs_quality_gates_in_order(emit_capture: list[str]) -> None:
+    runner = RecordingRunner()
     with pytest.raises(SystemExit) as exc_info:
-        devtools.check()
+        devtools.check(runner=runner)
     _assert_exit_ok(exc_info)
-    assert calls == [
+    assert runner.calls == [
         ["ruff", "format", "src", "tests"],
         ["pyright"],
         ["ruff", "check", "src", "tests", "--ignore-noqa"],
@@ -129,33 +127,26 @@ def test_check_runs_quality_gates_in_order(monkeypatch: pytest.MonkeyPatch) -> N
             "--cov-fail-under=85",
         ],
     ]
-    assert any("→ format" in msg for msg in emitted)
-    assert any("✓ format" in msg for msg in emitted)
-    assert "All checks passed" in emitted[-1]
+    emitted_output = "\n".join(emit_capture)
+    assert "→ format" in emitted_output
+    assert "✓ format" in emitted_output
+    assert "All checks passed" in emit_capture[-1]
 
 
-def test_check_stops_on_first_error(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_check_stops_on_first_error(emit_capture: list[str]) -> None:
     calls: list[list[str]] = []
-    returncodes = [0, 3]
-    emitted: list[str] = []
-
-    def fake_run(args: list[str], check: bool = False) -> SimpleNamespace:
-        calls.append(args)
-        code = returncodes.pop(0) if returncodes else 0
-        return SimpleNamespace(returncode=code)
-
-    def emit(msg: str) -> None:
-        emitted.append(msg)
+    returncodes = iter([0, 3])
 
-    monkeypatch.setattr(devtools.subprocess, "run", fake_run)
-    monkeypatch.setattr(devtools, "_emit", emit)
+    def fake_run(args: Sequence[str]) -> int:
+        calls.append(list(args))
+        return next(returncodes, 0)
 
     with pytest.raises(SystemExit) as exc_info:
-        devtools.check()
+        devtools.check(runner=fake_run)
 
     assert exc_info.value.code == 3
     assert calls == [
         ["ruff", "format", "src", "tests"],
         ["pyright"],
     ]
-    assert any("✗ typecheck failed" in msg for msg in emitted)
+    assert "✗ typecheck failed" in "\n".join(emit_capture)
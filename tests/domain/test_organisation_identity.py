@@ -95,6 +95,9 @@ class TestSplitOnDelimiters:
     def test_no_delimiter(self) -> None:
         assert split_on_delimiters("Just One Name") == ["Just One Name"]
 
+    def test_hyphenated_name_not_split(self) -> None:
+        assert split_on_delimiters("Rolls-Royce / R-R Motors") == ["Rolls-Royce", "R-R Motors"]
+
 
 class TestGenerateQueryVariants:
     """Tests for generate_query_variants function."""
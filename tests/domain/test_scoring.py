@@ -1,7 +1,11 @@
 """Tests for domain scoring logic."""
 
+import operator
+from collections.abc import Callable
 from types import MappingProxyType
 
+import pytest
+
 from tests.support.transform_enrich_rows import make_enrich_row
 from uk_sponsor_pipeline.domain.scoring import (
     ScoringFeatures,
@@ -72,42 +76,40 @@ def _make_profile(
     )
 
 
-class TestParseSicList:
-    """Tests for SIC code parsing."""
-
-    def test_semicolon_separated(self) -> None:
-        assert parse_sic_list("62020;63110") == ["62020", "63110"]
-
-    def test_comma_separated(self) -> None:
-        assert parse_sic_list("62020,63110") == ["62020", "63110"]
-
-    def test_empty_string(self) -> None:
-        assert parse_sic_list("") == []
-
-    def test_whitespace(self) -> None:
-        assert parse_sic_list(" 62020 ; 63110 ") == ["62020", "63110"]
-
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("62020;63110", ("62020", "63110")),
+        ("62020,63110", ("62020", "63110")),
+        ("", ()),
+        (" 62020 ; 63110 ", ("62020", "63110")),
+    ],
+    ids=["semicolon-separated", "comma-separated", "empty-string", "whitespace"],
+)
+def test_parse_sic_list(raw: str, expected: tuple[str, ...]) -> None:
+    assert parse_sic_list(raw) == expected
 
-class TestScoreFromSic:
-    """Tests for SIC-based scoring."""
 
-    def test_tech_sic_high_score(self) -> None:
+@pytest.mark.parametrize(
+    ("sic_codes", "compare", "threshold"),
+    [
         # 62020 = Computer consultancy, maps to 0.50 (max)
-        assert score_from_sic(["62020"]) == 0.50
-
-    def test_negative_sic_low_score(self) -> None:
-        # 87100 = Residential nursing care, has negative modifier
-        score = score_from_sic(["87100"])
-        assert score < 0.10  # Below baseline due to penalty
-
-    def test_mixed_sics(self) -> None:
-        # Mix of tech and other codes
-        score = score_from_sic(["62020", "41200"])
-        assert score >= 0.35  # Tech SIC should dominate
-
-    def test_unknown_sic(self) -> None:
+        (["62020"], operator.eq, 0.50),
+        # 87100 = Residential nursing care, below baseline due to penalty
+        (["87100"], operator.lt, 0.10),
+        # Tech SIC should dominate a mix with other codes
+        (["62020", "41200"], operator.ge, 0.35),
         # Non-tech SIC gets baseline
-        assert score_from_sic(["99999"]) == 0.10
+        (["99999"], operator.eq, 0.10),
+    ],
+    ids=["tech-sic-high-score", "negative-sic-low-score", "mixed-sics", "unknown-sic"],
+)
+def test_score_from_sic(
+    sic_codes: list[str],
+    compare: Callable[[float, float], bool],
+    threshold: float,
+) -> None:
+    assert compare(score_from_sic(sic_codes), threshold)
 
 
 class TestScoreCompanyAge:
@@ -150,35 +152,37 @@ class TestScoreNameKeywords:
         assert score_name_keywords("ABC Company") == 0
 
 
+_TECH_ROW = make_enrich_row(
+    **{
+        "ch_sic_codes": "62020",
+        "ch_company_status": "active",
+        "ch_date_of_creation": "2015-01-01",
+        "ch_company_type": "ltd",
+        "ch_company_name": "Tech Software Solutions Ltd",
+    }
+)
+_NON_TECH_ROW = make_enrich_row(
+    **{
+        "ch_sic_codes": "87100",  # Care home
+        "ch_company_status": "active",
+        "ch_date_of_creation": "2020-01-01",
+        "ch_company_type": "ltd",
+        "ch_company_name": "Care Home Services Ltd",
+    }
+)
+
+
 class TestCalculateFeatures:
     """Tests for full feature calculation."""
 
     def test_tech_company(self) -> None:
-        row = make_enrich_row(
-            **{
-                "ch_sic_codes": "62020",
-                "ch_company_status": "active",
-                "ch_date_of_creation": "2015-01-01",
-                "ch_company_type": "ltd",
-                "ch_company_name": "Tech Software Solutions Ltd",
-            }
-        )
-        features = calculate_features(row)
+        features = calculate_features(_TECH_ROW)
         assert features.sic_tech_score == 0.50
         assert features.is_active_score == 0.10
         assert features.bucket == "strong"
 
     def test_non_tech_company(self) -> None:
-        row = make_enrich_row(
-            **{
-                "ch_sic_codes": "87100",  # Care home
-                "ch_company_status": "active",
-                "ch_date_of_creation": "2020-01-01",
-                "ch_company_type": "ltd",
-                "ch_company_name": "Care Home Services Ltd",
-            }
-        )
-        features = calculate_features(row)
+        features = calculate_features(_NON_TECH_ROW)
         assert features.bucket == "unlikely"
 
     def test_profile_drives_sic_status_age_and_type_features(self) -> None:
@@ -259,6 +263,16 @@ class TestCalculateFeatures:
         assert features.bucket == "possible"
 
 
+# Feature scores (sic, active, age, type, keyword) and their expected total.
+_FEATURE_CASES = [
+    pytest.param((0.50, 0.10, 0.10, 0.05, 0.10), 0.85, id="plain-sum"),
+    pytest.param((0.50, 0.10, 0.15, 0.10, 0.20), 1.0, id="clamped-to-max"),
+    pytest.param((0.50, 0.10, 0.10, 0.05, 0.0), 0.75, id="zero-keyword"),
+    pytest.param((0.20, 0.10, 0.05, 0.05, 0.0), 0.40, id="low-sic"),
+    pytest.param((0.0, 0.0, 0.0, 0.0, -0.10), 0.0, id="clamped-to-min"),
+]
+
+
 class TestScoringFeatures:
     """Tests for ScoringFeatures dataclass."""
 
@@ -272,24 +286,22 @@ class TestScoringFeatures:
         )
         assert features.total == 0.85
 
-    def test_total_clamped(self) -> None:
-        features = ScoringFeatures(
-            sic_tech_score=0.50,
-            is_active_score=0.10,
-            company_age_score=0.15,
-            company_type_score=0.10,
-            name_keyword_score=0.20,
-        )
-        assert features.total == 1.0  # Clamped to max
-
-    def test_bucket_strong(self) -> None:
-        features = ScoringFeatures(0.50, 0.10, 0.10, 0.05, 0.0)
-        assert features.bucket == "strong"
-
-    def test_bucket_possible(self) -> None:
-        features = ScoringFeatures(0.20, 0.10, 0.05, 0.05, 0.0)
-        assert features.bucket == "possible"
-
-    def test_bucket_unlikely(self) -> None:
-        features = ScoringFeatures(0.0, 0.10, 0.05, 0.05, -0.05)
-        assert features.bucket == "unlikely"
+    @pytest.mark.parametrize(("features", "expected"), _FEATURE_CASES)
+    def test_total_is_clamped_sum_of_features(
+        self,
+        features: tuple[float, float, float, float, float],
+        expected: float,
+    ) -> None:
+        assert ScoringFeatures(*features).total == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("features", "expected"),
+        [
+            (ScoringFeatures(0.50, 0.10, 0.10, 0.05, 0.0), "strong"),
+            (ScoringFeatures(0.20, 0.10, 0.05, 0.05, 0.0), "possible"),
+            (ScoringFeatures(0.0, 0.10, 0.05, 0.05, -0.05), "unlikely"),
+        ],
+        ids=["strong", "possible", "unlikely"],
+    )
+    def test_bucket(self, features: ScoringFeatures, expected: str) -> None:
+        assert features.bucket == expected
@@ -2,7 +2,7 @@
 
 from .cache import InMemoryCache
 from .filesystem import InMemoryFileSystem
-from .http import FakeHttpClient
+from .http import FakeHttpClient, FakeResponse, FakeSession
 from .progress import FakeProgressReporter
 from .resilience import FakeCircuitBreaker, FakeRateLimiter
 
@@ -11,6 +11,8 @@ __all__ = [
     "FakeHttpClient",
     "FakeRateLimiter",
     "FakeProgressReporter",
+    "FakeResponse",
+    "FakeSession",
     "InMemoryCache",
     "InMemoryFileSystem",
 ]
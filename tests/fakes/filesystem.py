@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import fnmatch
 import io
 import time
 from collections.abc import Iterable, Mapping
@@ -31,6 +32,11 @@ class InMemoryFileSystem(FileSystem):
     _files: dict[str, object] = field(default_factory=_empty_files)
     _mtimes: dict[str, float] = field(default_factory=_empty_mtimes)
 
+    def reset(self) -> None:
+        """Remove all stored files so the instance can be reused by another test."""
+        self._files.clear()
+        self._mtimes.clear()
+
     @override
     def read_csv(self, path: Path) -> pd.DataFrame:
         key = str(path)
@@ -185,8 +191,6 @@ class InMemoryFileSystem(FileSystem):
 
     @override
     def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
-        import fnmatch
-
         prefix = str(path)
         matches: list[Path] = []
         for key in self._files:
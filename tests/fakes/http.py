@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import json
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from typing import override
 
+import requests
+from requests.structures import CaseInsensitiveDict
+
 from tests.support.errors import FakeResponseMissingError
 from uk_sponsor_pipeline.protocols import HttpClient
 
@@ -32,3 +38,78 @@ class FakeHttpClient(HttpClient):
             if pattern in url:
                 return response
         raise FakeResponseMissingError(url)
+
+
+class FakeResponse(requests.Response):
+    """Requests response with a canned status, headers, and body.
+
+    The body is held in memory, so `text`, `json()`, `iter_content()` and
+    `raise_for_status()` use the real requests implementations. Pass `chunks` to
+    have `iter_content()` replay exact stream chunks instead, including the empty
+    keep-alive chunks a real stream can yield.
+    """
+
+    def __init__(
+        self,
+        *,
+        status_code: int = 200,
+        json_data: object | None = None,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        chunks: Iterable[bytes] | None = None,
+    ) -> None:
+        super().__init__()
+        self._chunks = None if chunks is None else tuple(chunks)
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(dict(headers or {}))
+        self.encoding = "utf-8"
+        if body is None:
+            body = b"" if json_data is None else json.dumps(json_data).encode("utf-8")
+        self._content = body
+        self._content_consumed = True
+
+    @override
+    def iter_content(
+        self, chunk_size: int | None = 1, decode_unicode: bool = False
+    ) -> Iterator[bytes]:
+        if self._chunks is None:
+            return super().iter_content(chunk_size=chunk_size, decode_unicode=decode_unicode)
+        return iter(self._chunks)
+
+
+class FakeSession(requests.Session):
+    """Requests session that replays canned responses or exceptions in order.
+
+    A call beyond the supplied outcomes raises `FakeResponseMissingError`, unless
+    `repeat_last` is set, in which case the final outcome is replayed.
+    """
+
+    def __init__(
+        self,
+        outcomes: Iterable[FakeResponse | Exception],
+        *,
+        repeat_last: bool = False,
+    ) -> None:
+        super().__init__()
+        self._outcomes: deque[FakeResponse | Exception] = deque(outcomes)
+        self._repeat_last = repeat_last
+        self._last: FakeResponse | Exception | None = None
+        self.calls: list[tuple[str, dict[str, object]]] = []
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    @override
+    def get(self, url: str | bytes, **kwargs: object) -> requests.Response:
+        self.calls.append((str(url), kwargs))
+        if self._outcomes:
+            outcome = self._outcomes.popleft()
+            self._last = outcome
+        elif self._repeat_last and self._last is not None:
+            outcome = self._last
+        else:
+            raise FakeResponseMissingError(str(url))
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
@@ -38,3 +38,18 @@ class TestInMemoryFileSystemOpenHandles:
             handle.write(b"\x30")
 
         assert fs.read_bytes(path) == b"\x10\x20\x30"
+
+
+class TestInMemoryFileSystemReset:
+    """Validate reuse of a single in-memory filesystem across tests."""
+
+    def test_reset_removes_files_and_mtimes(self) -> None:
+        fs = InMemoryFileSystem()
+        path = Path("data/tmp/example.txt")
+        fs.write_text("alpha", path)
+
+        fs.reset()
+
+        assert fs.exists(path) is False
+        assert fs.mtime(path) == 0.0
+        assert fs.list_files(Path("data")) == []
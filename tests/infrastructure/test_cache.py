@@ -26,3 +26,15 @@ class TestDiskCache:
         assert cache.has("missing") is False
         cache.set("exists", {"data": True})
         assert cache.has("exists") is True
+
+    def test_entries_persist_across_instances(self, tmp_path: Path) -> None:
+        """Entries written by one instance are visible to a new instance."""
+        DiskCache(tmp_path / "cache").set("mykey", {"test": "value"})
+        assert DiskCache(tmp_path / "cache").get("mykey") == {"test": "value"}
+
+    def test_set_replaces_existing_entry(self, tmp_path: Path) -> None:
+        """set() overwrites an existing key."""
+        cache = DiskCache(tmp_path / "cache")
+        cache.set("mykey", {"version": 1})
+        cache.set("mykey", {"version": 2})
+        assert cache.get("mykey") == {"version": 2}
@@ -1,13 +1,17 @@
 """Tests for HTTP infrastructure components."""
 
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from email.utils import format_datetime
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import requests
 from requests.auth import HTTPBasicAuth
 
+from tests.fakes import FakeResponse, FakeSession, InMemoryCache
 from uk_sponsor_pipeline.exceptions import (
     AuthenticationError,
     CircuitBreakerOpen,
@@ -20,6 +24,7 @@ from uk_sponsor_pipeline.infrastructure import (
     RateLimiter,
     RequestsSession,
     RetryPolicy,
+    build_companies_house_client,
     is_auth_error,
     is_rate_limit_error,
     parse_retry_after,
@@ -27,100 +32,113 @@ from uk_sponsor_pipeline.infrastructure import (
 from uk_sponsor_pipeline.protocols import Cache
 
 
+def _make_client(
+    session: requests.Session | None = None,
+    cache: Cache | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    retry_policy: RetryPolicy | None = None,
+) -> CachedHttpClient:
+    """Create a CachedHttpClient with fakes."""
+    if session is None:
+        session = FakeSession([FakeResponse(json_data={})])
+    if cache is None:
+        cache = InMemoryCache()
+    if circuit_breaker is None:
+        circuit_breaker = CircuitBreaker(threshold=3)
+    rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
+    retry_policy = retry_policy or RetryPolicy(max_retries=0, backoff_factor=0, jitter_seconds=0)
+    return CachedHttpClient(
+        session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        retry_policy=retry_policy,
+    )
+
+
+def _make_retrying_client(session: requests.Session) -> CachedHttpClient:
+    """Create a CachedHttpClient with the default retry policy."""
+    return _make_client(session=session, retry_policy=RetryPolicy())
+
+
 class TestCachedHttpClientAuth:
     """Tests for CachedHttpClient auth header passing."""
 
     def test_session_headers_are_used(self) -> None:
         """Verify that session.get is invoked when using CachedHttpClient."""
-        # Create a mock session
-        mock_session = MagicMock(spec=requests.Session)
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"items": []}
-        mock_session.get.return_value = mock_response
+        session = FakeSession([FakeResponse(json_data={"items": []})])
 
         # Add auth to session
         api_key = "test-key-123"
-        mock_session.auth = HTTPBasicAuth(api_key, "")
+        session.auth = HTTPBasicAuth(api_key, "")
 
-        # Create cache, rate limiter, and circuit breaker
-        cache = MagicMock()
-        cache.get.return_value = None  # Cache miss
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
-        circuit_breaker = CircuitBreaker(threshold=5)
-
-        client = CachedHttpClient(
-            session=mock_session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-        )
+        client = _make_client(session=session)
 
         # Make a request
         client.get_json("https://api.example.com/test", "cache_key")
 
         # Verify session.get was called (which uses session headers)
-        mock_session.get.assert_called_once()
-        call_args = mock_session.get.call_args
-        assert call_args[0][0] == "https://api.example.com/test"
-
-
-class TestHttpClientWithErrors:
-    """Tests for HTTP client error handling."""
-
-    def test_401_raises_auth_error_immediately(self) -> None:
-        """Verify that 401 errors raise AuthenticationError immediately."""
-        mock_session = MagicMock(spec=requests.Session)
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_session.get.return_value = mock_response
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
-        circuit_breaker = CircuitBreaker(threshold=5)
-
-        client = CachedHttpClient(
-            session=mock_session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
+        assert session.call_count == 1
+        assert session.calls[0][0] == "https://api.example.com/test"
+
+
+class TestBuildCompaniesHouseClient:
+    """Tests for the Companies House client builder."""
+
+    @pytest.mark.parametrize(
+        "api_key",
+        ["test-api-key-for-verification", "a06e8c82-0b3b-4b1a-9c1a-1a2b3c4d5e6f"],
+        ids=["plain", "uuid_format"],
+    )
+    def test_session_uses_api_key_basic_auth(self, tmp_path: Path, api_key: str) -> None:
+        """The API key is sent as the basic auth username with an empty password."""
+        client = build_companies_house_client(
+            api_key=api_key,
+            cache_dir=tmp_path / "cache",
+            max_rpm=600,
+            min_delay_seconds=0,
+            circuit_breaker_threshold=5,
+            circuit_breaker_timeout_seconds=60,
+            max_retries=0,
+            backoff_factor=0,
+            max_backoff_seconds=0,
+            jitter_seconds=0,
+            timeout_seconds=5,
         )
 
-        # Should raise AuthenticationError, not HTTPError
-        with pytest.raises(AuthenticationError):
-            client.get_json("https://api.example.com/test", "cache_key")
-
-        # Should only make ONE request
-        assert mock_session.get.call_count == 1
+        assert client.session.auth == HTTPBasicAuth(api_key, "")
 
-    def test_403_raises_auth_error_immediately(self) -> None:
-        """Verify that 403 Forbidden (IP ban) raises AuthenticationError immediately."""
-        mock_session = MagicMock(spec=requests.Session)
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        mock_session.get.return_value = mock_response
 
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
-        circuit_breaker = CircuitBreaker(threshold=5)
+class TestHttpClientWithErrors:
+    """Tests for HTTP client error handling."""
 
-        client = CachedHttpClient(
-            session=mock_session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-        )
+    @pytest.mark.parametrize(
+        "make_client",
+        [_make_client, _make_retrying_client],
+        ids=["no_retries", "default_retries"],
+    )
+    @pytest.mark.parametrize(
+        "status_code",
+        [401, 403],
+        ids=["unauthorised", "forbidden"],
+    )
+    def test_auth_status_raises_auth_error_immediately(
+        self,
+        status_code: int,
+        make_client: Callable[[requests.Session], CachedHttpClient],
+    ) -> None:
+        """Verify that 401 and 403 (IP ban) raise AuthenticationError without retrying."""
+        session = FakeSession([FakeResponse(status_code=status_code)])
+        client = make_client(session)
 
         # Should raise AuthenticationError, not HTTPError
         with pytest.raises(AuthenticationError) as exc_info:
             client.get_json("https://api.example.com/test", "cache_key")
 
         # Should only make ONE request
-        assert mock_session.get.call_count == 1
-        # Error message should mention 403
-        assert "403" in str(exc_info.value)
+        assert session.call_count == 1
+        # Error message should mention the status code
+        assert str(status_code) in str(exc_info.value)
 
 
 class TestIsAuthError:
@@ -128,10 +146,8 @@ class TestIsAuthError:
 
     def test_detects_401_status_code(self) -> None:
         """Detects 401 status code in HTTPError response."""
-        response = MagicMock()
-        response.status_code = 401
         error = requests.HTTPError()
-        error.response = response
+        error.response = FakeResponse(status_code=401)
         assert is_auth_error(error) is True
 
     def test_detects_401_in_string(self) -> None:
@@ -149,16 +165,26 @@ class TestIsAuthError:
         error = Exception("Connection timeout")
         assert is_auth_error(error) is False
 
+    def test_detects_403_status_code(self) -> None:
+        """Detects 403 status code in HTTPError response."""
+        error = requests.HTTPError()
+        error.response = FakeResponse(status_code=403)
+        assert is_auth_error(error) is True
+
+    def test_status_code_takes_precedence_over_message(self) -> None:
+        """Ignores '401' in the message when the response status is not an auth code."""
+        error = requests.HTTPError("500 Server Error for url: /company/00000401")
+        error.response = FakeResponse(status_code=500)
+        assert is_auth_error(error) is False
+
 
 class TestIsRateLimitError:
     """Tests for is_rate_limit_error helper."""
 
     def test_detects_429_status_code(self) -> None:
         """Detects 429 status code in HTTPError response."""
-        response = MagicMock()
-        response.status_code = 429
         error = requests.HTTPError()
-        error.response = response
+        error.response = FakeResponse(status_code=429)
         assert is_rate_limit_error(error) is True
 
     def test_detects_429_in_string(self) -> None:
@@ -171,6 +197,12 @@ class TestIsRateLimitError:
         error = Exception("Connection timeout")
         assert is_rate_limit_error(error) is False
 
+    def test_status_code_takes_precedence_over_message(self) -> None:
+        """Ignores '429' in the message when the response status is not 429."""
+        error = requests.HTTPError("500 Server Error for url: /company/00000429")
+        error.response = FakeResponse(status_code=500)
+        assert is_rate_limit_error(error) is False
+
 
 class TestParseRetryAfter:
     """Tests for Retry-After parsing."""
@@ -192,93 +224,23 @@ class TestParseRetryAfter:
 class TestCachedHttpClient:
     """Tests for CachedHttpClient error handling."""
 
-    def _make_client(
-        self,
-        session: requests.Session | None = None,
-        cache: Cache | None = None,
-        retry_policy: RetryPolicy | None = None,
-    ) -> CachedHttpClient:
-        """Create a CachedHttpClient with mocks."""
-        if session is None:
-            session = MagicMock(spec=requests.Session)
-        if cache is None:
-            cache = MagicMock(spec=Cache)
-            cache.get.return_value = None  # Cache miss by default
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
-        circuit_breaker = CircuitBreaker(threshold=3)
-        retry_policy = retry_policy or RetryPolicy(
-            max_retries=0, backoff_factor=0, jitter_seconds=0
-        )
-        return CachedHttpClient(
-            session=session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-            retry_policy=retry_policy,
-        )
-
     def test_returns_cached_response(self) -> None:
         """Returns cached response without making HTTP request."""
-        cache = MagicMock()
-        cache.get.return_value = {"cached": True}
-        session = MagicMock(spec=requests.Session)
-        client = self._make_client(session=session, cache=cache)
+        cache = InMemoryCache()
+        cache.set("cache_key", {"cached": True})
+        session = FakeSession([FakeResponse(json_data={"cached": False})])
+        client = _make_client(session=session, cache=cache)
 
         result = client.get_json("https://example.com", "cache_key")
 
         assert result == {"cached": True}
-        session.get.assert_not_called()
-
-    def test_raises_auth_error_on_401(self) -> None:
-        """Raises AuthenticationError immediately on 401 response."""
-        session = MagicMock(spec=requests.Session)
-        response = MagicMock()
-        response.status_code = 401
-        session.get.return_value = response
-
-        client = self._make_client(session=session)
-
-        with pytest.raises(AuthenticationError):
-            client.get_json("https://example.com", None)
-
-        # Should only make ONE request before failing
-        assert session.get.call_count == 1
-
-    def test_raises_auth_error_on_403(self) -> None:
-        """Raises AuthenticationError immediately on 403 Forbidden (IP ban)."""
-        session = MagicMock(spec=requests.Session)
-        response = MagicMock()
-        response.status_code = 403
-        session.get.return_value = response
-
-        client = self._make_client(session=session)
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            client.get_json("https://example.com", None)
-
-        # Should only make ONE request before failing
-        assert session.get.call_count == 1
-        # Error message should mention 403
-        assert "403" in str(exc_info.value)
+        assert session.call_count == 0
 
     def test_circuit_breaker_opens_on_repeated_401(self) -> None:
         """Circuit breaker opens after repeated 401 errors."""
-        session = MagicMock(spec=requests.Session)
-        response = MagicMock()
-        response.status_code = 401
-        session.get.return_value = response
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
+        session = FakeSession([FakeResponse(status_code=401), FakeResponse(status_code=401)])
         circuit_breaker = CircuitBreaker(threshold=2)
-        client = CachedHttpClient(
-            session=session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-            retry_policy=RetryPolicy(max_retries=0, backoff_factor=0, jitter_seconds=0),
-        )
+        client = _make_client(session=session, circuit_breaker=circuit_breaker)
 
         # First 401
         with pytest.raises(AuthenticationError):
@@ -293,27 +255,13 @@ class TestCachedHttpClient:
             client.get_json("https://example.com/3", None)
 
         # Only 2 requests made - third was blocked by circuit breaker
-        assert session.get.call_count == 2
+        assert session.call_count == 2
 
     def test_records_failure_on_http_error(self) -> None:
         """Records failure in circuit breaker for HTTP errors."""
-        session = MagicMock(spec=requests.Session)
-        response = MagicMock()
-        response.status_code = 500
-        response.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
-        session.get.return_value = response
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
+        session = FakeSession([FakeResponse(status_code=500)])
         circuit_breaker = CircuitBreaker(threshold=3)
-        client = CachedHttpClient(
-            session=session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-            retry_policy=RetryPolicy(max_retries=0, backoff_factor=0, jitter_seconds=0),
-        )
+        client = _make_client(session=session, circuit_breaker=circuit_breaker)
 
         with pytest.raises(requests.HTTPError):
             client.get_json("https://example.com", None)
@@ -322,26 +270,9 @@ class TestCachedHttpClient:
 
     def test_non_network_error_does_not_record_failure(self) -> None:
         """Does not record circuit breaker failures for non-network errors."""
-        session = MagicMock(spec=requests.Session)
-        response = MagicMock()
-        response.status_code = 200
-        response.text = "not-json"
-        response.raise_for_status.return_value = None
-        response.json.return_value = ["not", "an", "object"]
-        session.get.return_value = response
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
+        session = FakeSession([FakeResponse(json_data=["not", "an", "object"])])
         circuit_breaker = CircuitBreaker(threshold=3)
-        retry_policy = RetryPolicy(max_retries=0, backoff_factor=0, jitter_seconds=0)
-        client = CachedHttpClient(
-            session=session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-            retry_policy=retry_policy,
-        )
+        client = _make_client(session=session, circuit_breaker=circuit_breaker)
 
         with pytest.raises(JsonObjectExpectedError):
             client.get_json("https://example.com", None)
@@ -350,24 +281,10 @@ class TestCachedHttpClient:
 
     def test_success_resets_circuit_breaker(self) -> None:
         """Successful request resets circuit breaker failures."""
-        session = MagicMock(spec=requests.Session)
-        response = MagicMock()
-        response.status_code = 200
-        response.json.return_value = {"success": True}
-        session.get.return_value = response
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
+        session = FakeSession([FakeResponse(json_data={"success": True})])
         circuit_breaker = CircuitBreaker(threshold=3)
         circuit_breaker.consecutive_failures = 2  # Pre-set some failures
-        client = CachedHttpClient(
-            session=session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-            retry_policy=RetryPolicy(max_retries=0, backoff_factor=0, jitter_seconds=0),
-        )
+        client = _make_client(session=session, circuit_breaker=circuit_breaker)
 
         client.get_json("https://example.com", None)
 
@@ -375,64 +292,72 @@ class TestCachedHttpClient:
 
     def test_caches_successful_response(self) -> None:
         """Caches successful response."""
-        session = MagicMock(spec=requests.Session)
-        response = MagicMock()
-        response.status_code = 200
-        response.json.return_value = {"data": "test"}
-        session.get.return_value = response
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        client = self._make_client(session=session, cache=cache)
+        session = FakeSession([FakeResponse(json_data={"data": "test"})])
+        cache = InMemoryCache()
+        client = _make_client(session=session, cache=cache)
 
         client.get_json("https://example.com", "my_cache_key")
 
-        cache.set.assert_called_once_with("my_cache_key", {"data": "test"})
+        assert cache.get("my_cache_key") == {"data": "test"}
 
     def test_retries_on_429_then_success(self) -> None:
         """Retries on 429 and succeeds on next attempt."""
-        session = MagicMock(spec=requests.Session)
-        resp1 = MagicMock()
-        resp1.status_code = 429
-        resp1.headers = {"Retry-After": "5"}
-        resp2 = MagicMock()
-        resp2.status_code = 200
-        resp2.json.return_value = {"ok": True}
-        session.get.side_effect = [resp1, resp2]
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
-        circuit_breaker = CircuitBreaker(threshold=3)
-        retry_policy = RetryPolicy(max_retries=1, backoff_factor=0, jitter_seconds=0)
-
-        client = CachedHttpClient(
-            session=session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-            retry_policy=retry_policy,
+        session = FakeSession(
+            [
+                FakeResponse(status_code=429, headers={"Retry-After": "5"}),
+                FakeResponse(json_data={"ok": True}),
+            ]
         )
+        retry_policy = RetryPolicy(max_retries=1, backoff_factor=0, jitter_seconds=0)
+        client = _make_client(session=session, retry_policy=retry_policy)
 
         with patch("uk_sponsor_pipeline.infrastructure.io.http.time.sleep") as sleep_mock:
             result = client.get_json("https://example.com", None)
             sleep_mock.assert_called()
 
         assert result == {"ok": True}
-        assert session.get.call_count == 2
+        assert session.call_count == 2
+
+    def test_retry_backoff_counts_towards_rate_limit_delay(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The rate limiter does not add its minimum delay on top of a retry backoff."""
+        clock = [1_000.0]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+        session = FakeSession(
+            [
+                FakeResponse(status_code=429, headers={"Retry-After": "5"}),
+                FakeResponse(json_data={"ok": True}),
+            ]
+        )
+        client = CachedHttpClient(
+            session=session,
+            cache=InMemoryCache(),
+            rate_limiter=RateLimiter(max_rpm=0, min_delay_seconds=2),
+            circuit_breaker=CircuitBreaker(threshold=3),
+            retry_policy=RetryPolicy(max_retries=1, backoff_factor=0, jitter_seconds=0),
+        )
+
+        client.get_json("https://example.com", None)
+
+        assert sleeps == [5.0]
 
 
 class TestRequestsSessionIterBytes:
     """Tests for RequestsSession.iter_bytes."""
 
     def test_iter_bytes_streams_chunks(self) -> None:
-        mock_session = MagicMock(spec=requests.Session)
-        mock_response = MagicMock()
-        mock_response.iter_content.return_value = [b"a", b"", b"b"]
-        mock_response.__enter__.return_value = mock_response
-        mock_session.get.return_value = mock_response
+        fake_session = FakeSession([FakeResponse(body=b"abc")])
 
-        session = RequestsSession(session=mock_session)
+        session = RequestsSession(session=fake_session)
         chunks = list(
             session.iter_bytes(
                 "https://example.com/data",
@@ -441,71 +366,48 @@ class TestRequestsSessionIterBytes:
             )
         )
 
-        assert chunks == [b"a", b"b"]
-        mock_session.get.assert_called_once_with(
-            "https://example.com/data",
-            timeout=5,
-            stream=True,
+        assert chunks == [b"ab", b"c"]
+        assert fake_session.calls == [
+            ("https://example.com/data", {"timeout": 5, "stream": True}),
+        ]
+
+    def test_iter_bytes_drops_empty_chunks(self) -> None:
+        fake_session = FakeSession([FakeResponse(chunks=[b"ab", b"", b"c", b""])])
+
+        session = RequestsSession(session=fake_session)
+        chunks = list(
+            session.iter_bytes(
+                "https://example.com/data",
+                timeout_seconds=5,
+                chunk_size=2,
+            )
         )
-        mock_response.raise_for_status.assert_called_once()
-        mock_response.iter_content.assert_called_once_with(chunk_size=2)
+
+        assert chunks == [b"ab", b"c"]
 
     def test_rate_limit_error_after_retries_exhausted(self) -> None:
         """Raises RateLimitError after exhausting retries for 429."""
-        session = MagicMock(spec=requests.Session)
-        resp1 = MagicMock()
-        resp1.status_code = 429
-        resp1.headers = {"Retry-After": "3"}
-        resp2 = MagicMock()
-        resp2.status_code = 429
-        resp2.headers = {"Retry-After": "3"}
-        session.get.side_effect = [resp1, resp2]
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
-        circuit_breaker = CircuitBreaker(threshold=3)
-        retry_policy = RetryPolicy(max_retries=1, backoff_factor=0, jitter_seconds=0)
-
-        client = CachedHttpClient(
-            session=session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-            retry_policy=retry_policy,
+        session = FakeSession(
+            [FakeResponse(status_code=429, headers={"Retry-After": "3"})], repeat_last=True
         )
+        retry_policy = RetryPolicy(max_retries=1, backoff_factor=0, jitter_seconds=0)
+        client = _make_client(session=session, retry_policy=retry_policy)
 
         with patch("uk_sponsor_pipeline.infrastructure.io.http.time.sleep"):
             with pytest.raises(RateLimitError) as exc_info:
                 client.get_json("https://example.com", None)
 
         assert exc_info.value.retry_after == 3
-        assert session.get.call_count == 2
+        assert session.call_count == 2
 
     def test_retries_on_timeout_then_success(self) -> None:
         """Retries on timeout exception and succeeds."""
-        session = MagicMock(spec=requests.Session)
-        resp = MagicMock()
-        resp.status_code = 200
-        resp.json.return_value = {"ok": True}
-        session.get.side_effect = [requests.Timeout("timeout"), resp]
-
-        cache = MagicMock()
-        cache.get.return_value = None
-        rate_limiter = RateLimiter(max_rpm=600, min_delay_seconds=0)
-        circuit_breaker = CircuitBreaker(threshold=3)
+        session = FakeSession([requests.Timeout("timeout"), FakeResponse(json_data={"ok": True})])
         retry_policy = RetryPolicy(max_retries=1, backoff_factor=0, jitter_seconds=0)
-
-        client = CachedHttpClient(
-            session=session,
-            cache=cache,
-            rate_limiter=rate_limiter,
-            circuit_breaker=circuit_breaker,
-            retry_policy=retry_policy,
-        )
+        client = _make_client(session=session, retry_policy=retry_policy)
 
         with patch("uk_sponsor_pipeline.infrastructure.io.http.time.sleep"):
             result = client.get_json("https://example.com", None)
 
         assert result == {"ok": True}
-        assert session.get.call_count == 2
+        assert session.call_count == 2
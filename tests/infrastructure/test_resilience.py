@@ -86,6 +86,73 @@ class TestCircuitBreaker:
         with pytest.raises(CircuitBreakerOpen):
             cb.check()
 
+    def test_failed_probe_doubles_cooldown(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each failed half-open probe reopens with twice the previous cooldown."""
+        clock = [1_000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        cb = CircuitBreaker(
+            threshold=1,
+            recovery_timeout_seconds=10,
+            max_recovery_timeout_seconds=25,
+        )
+
+        cooldowns: list[float] = []
+        cb.record_failure()
+        for _ in range(3):
+            assert cb.open_until is not None
+            cooldowns.append(cb.open_until - clock[0])
+            clock[0] = cb.open_until
+            cb.check()  # Probe allowed
+            cb.record_failure()
+
+        assert cooldowns == [10, 20, 25]
+
+    def test_cap_never_shortens_base_cooldown(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A base timeout above the default cap is used as-is and not doubled."""
+        clock = [1_000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        cb = CircuitBreaker(threshold=1, recovery_timeout_seconds=900)
+
+        cooldowns: list[float] = []
+        cb.record_failure()
+        for _ in range(2):
+            assert cb.open_until is not None
+            cooldowns.append(cb.open_until - clock[0])
+            clock[0] = cb.open_until
+            cb.check()  # Probe allowed
+            cb.record_failure()
+
+        assert cooldowns == [900, 900]
+
+    def test_repeated_reopening_does_not_overflow(self) -> None:
+        """Thousands of failed probes keep failing fast instead of raising OverflowError."""
+        cb = CircuitBreaker(threshold=1, recovery_timeout_seconds=0.0)
+        cb.record_failure()
+
+        for _ in range(2_000):
+            cb.check()  # Zero cooldown: probe allowed immediately
+            cb.record_failure()
+
+        assert cb.is_open
+
+    def test_success_resets_cooldown(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A successful probe restores the base cooldown for the next opening."""
+        clock = [1_000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        cb = CircuitBreaker(threshold=1, recovery_timeout_seconds=10)
+        cb.record_failure()
+        assert cb.open_until is not None
+        clock[0] = cb.open_until
+        cb.check()
+        cb.record_failure()  # Failed probe: cooldown doubles
+        assert cb.open_until is not None
+        clock[0] = cb.open_until
+        cb.check()
+        cb.record_success()
+
+        cb.record_failure()
+        assert cb.open_until == clock[0] + 10
+
 
 class TestRateLimiter:
     """Tests for RateLimiter behaviour."""
@@ -102,12 +169,49 @@ class TestRateLimiter:
         # Second call should have waited at least 0.1s
         assert elapsed >= 0.1
 
-    def test_tracks_requests_per_minute(self) -> None:
-        """Rate limiter tracks requests in current minute."""
-        rl = RateLimiter(max_rpm=5, min_delay_seconds=0)
+    def test_never_exceeds_max_rpm_in_any_minute(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """No 60-second window admits more than max_rpm requests."""
+        clock = [1_000.0]
+
+        def fake_sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+        rl = RateLimiter(max_rpm=100, min_delay_seconds=0)
+
+        admitted: list[float] = []
+        for _ in range(250):
+            rl.wait_if_needed()
+            admitted.append(clock[0])
+
+        # The (max_rpm + 1)th request after any admission is at least a minute later.
+        gaps = [later - earlier for earlier, later in zip(admitted, admitted[100:], strict=False)]
+        assert min(gaps) >= 60.0 - 1e-9
+
+    def test_spaces_requests_by_rate_interval(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The first request is immediate; later ones wait one interval each."""
+        clock = [1_000.0]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+        rl = RateLimiter(max_rpm=60, min_delay_seconds=0)
+
         for _ in range(3):
             rl.wait_if_needed()
-        assert rl.requests_this_minute == 3
+
+        assert sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
 
 
 class TestRetryPolicy:
@@ -3,6 +3,7 @@
 import socket
 
 import pytest
+import requests
 
 from tests.support.errors import NetworkIsolationError
 
@@ -22,8 +23,6 @@ class TestNetworkBlocking:
 
     def test_requests_would_fail_without_mock(self) -> None:
         """Importing requests and trying to use it would fail without mocking."""
-        import requests
-
         # This would try to make a real connection if not mocked
         # The socket blocking will prevent it
         with pytest.raises(NetworkIsolationError) as exc_info:
@@ -0,0 +1,44 @@
+"""Shared register transform run for tests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from uk_sponsor_pipeline.application.transform_register import (
+    TransformRegisterResult,
+    run_transform_register,
+)
+from uk_sponsor_pipeline.infrastructure import LocalFileSystem
+from uk_sponsor_pipeline.io_validation import validate_json_as
+
+
+@dataclass(frozen=True)
+class TransformRegisterOutput:
+    """Result, output frame, and stats from one register transform run."""
+
+    result: TransformRegisterResult
+    df: pd.DataFrame
+    stats: dict[str, object]
+
+
+def run_transform_register_once(raw_csv: pd.DataFrame, root: Path) -> TransformRegisterOutput:
+    """Run the register transform on a raw frame and read back its outputs."""
+    raw_dir = root / "raw"
+    raw_dir.mkdir()
+    raw_csv.to_csv(raw_dir / "input.csv", index=False)
+
+    out_path = root / "interim" / "sponsor_register_filtered.csv"
+    reports_dir = root / "reports"
+    result = run_transform_register(
+        raw_dir=raw_dir,
+        out_path=out_path,
+        reports_dir=reports_dir,
+        fs=LocalFileSystem(),
+    )
+
+    df = pd.read_csv(out_path, dtype=str).fillna("")
+    stats = validate_json_as(dict[str, object], (reports_dir / "register_stats.json").read_bytes())
+    return TransformRegisterOutput(result=result, df=df, stats=stats)